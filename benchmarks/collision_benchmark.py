@@ -0,0 +1,124 @@
+"""Cost and accuracy of swept versus discrete collisions at fixed running speeds.
+
+Runs the headless simulation with the player invulnerable, so every seed sees the same
+obstacles whatever the collision mode, and reports per mode and speed:
+
+- how many obstacles touched the player and how many coins were collected,
+- the hits missed compared with a reference that tests many points along every step,
+- the mean and p95 cost of handle_collisions per tick.
+
+Run from the repository root:
+
+    python -m benchmarks.collision_benchmark
+    python -m benchmarks.collision_benchmark --speeds 1000 5000 --seeds 50 --output results.json
+"""
+import argparse
+import json
+import sys
+import time
+
+from benchmarks.frame_benchmark import summarize
+
+# Collision modes compared; "sampled" is the accuracy reference, not a real game mode
+MODES = ("discrete", "swept", "sampled")
+
+# Points tested along each step by the sampled reference
+REFERENCE_SAMPLES = 32
+
+DEFAULT_SPEEDS = (200, 1000, 3000, 5000)
+DEFAULT_SEEDS = 20
+DEFAULT_TICKS = 1800  # 30 seconds of play per seed
+JUMP_EVERY = 45
+
+
+def sampled_touching(simulation):
+    """Return a touching() replacement that tests REFERENCE_SAMPLES points along every step."""
+    def touching(kind, entities):
+        player = simulation.player
+        found = []
+        for entity in entities:
+            x_min, x_max, y_min, y_max, sum_min, sum_max, diff_min, diff_max = simulation.contact_window(kind, entity.scale)
+            x0 = entity.prev_x - player.x
+            y0 = entity.prev_y - player.prev_y
+            x1 = entity.x - player.x
+            y1 = entity.y - player.y
+            for i in range(REFERENCE_SAMPLES + 1):
+                t = i / REFERENCE_SAMPLES
+                x = x0 + (x1 - x0) * t
+                y = y0 + (y1 - y0) * t
+                if x_min < x < x_max and y_min < y < y_max and sum_min < x + y < sum_max and diff_min < x - y < diff_max:
+                    found.append(entity)
+                    break
+        return found
+    return touching
+
+
+def run(mode, speed, seed, ticks):
+    """Play one seed at a fixed speed; returns (obstacle ids hit, coins collected, collision times)."""
+    from core.simulation import Simulation, INPUT_JUMP
+
+    simulation = Simulation(seed=seed, ambient=False)
+    simulation.invulnerable = True
+    simulation.speed_increase_rate = 0
+    simulation.running_speed = speed
+    simulation.swept_collisions = mode != "discrete"
+    touching = sampled_touching(simulation) if mode == "sampled" else simulation.touching
+
+    hit = set()
+
+    def counting_touching(kind, entities):
+        found = touching(kind, entities)
+        if kind == "obstacle":
+            hit.update(entity.id for entity in found)
+        return found
+
+    simulation.touching = counting_touching
+    handle_collisions = simulation.handle_collisions
+    samples = []
+
+    def timed_handle_collisions():
+        start = time.perf_counter()
+        handle_collisions()
+        samples.append(time.perf_counter() - start)
+
+    simulation.handle_collisions = timed_handle_collisions
+    for tick in range(ticks):
+        simulation.step(1 / 60, (INPUT_JUMP,) if tick % JUMP_EVERY == 0 else ())
+    return hit, simulation.coins_collected, samples
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare swept and discrete collisions in the ComeHome simulation.")
+    parser.add_argument("--speeds", type=int, nargs="+", default=list(DEFAULT_SPEEDS), help="Running speeds to test")
+    parser.add_argument("--seeds", type=int, default=DEFAULT_SEEDS, help="Seeds per speed")
+    parser.add_argument("--ticks", type=int, default=DEFAULT_TICKS, help="Ticks per seed")
+    parser.add_argument("--output", help="Write the JSON report to this file instead of stdout")
+    args = parser.parse_args(argv)
+
+    results = {"meta": {"seeds": args.seeds, "ticks": args.ticks}, "speeds": {}}
+    for speed in args.speeds:
+        print(f"Running speed {speed}...", file=sys.stderr)
+        runs = {mode: [run(mode, speed, seed, args.ticks) for seed in range(args.seeds)] for mode in MODES}
+        reference = runs["sampled"]
+        report = {}
+        for mode in MODES:
+            report[mode] = {
+                "obstacle_hits": sum(len(hit) for hit, _, _ in runs[mode]),
+                "missed_hits": sum(len(ref[0] - hit) for (hit, _, _), ref in zip(runs[mode], reference)),
+                "extra_hits": sum(len(hit - ref[0]) for (hit, _, _), ref in zip(runs[mode], reference)),
+                "coins_collected": sum(coins for _, coins, _ in runs[mode]),
+                "handle_collisions": summarize([sample for _, _, samples in runs[mode] for sample in samples]),
+            }
+        results["speeds"][str(speed)] = report
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(output + "\n")
+    else:
+        print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
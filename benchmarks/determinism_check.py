@@ -0,0 +1,100 @@
+"""Check that the headless simulation is deterministic, which replays, retry and suspend rely on.
+
+For each seed a bot plays a run through the simulation while it is recorded like the game
+window records it. The run must then come out the same, down to every byte of its final world
+snapshot, when:
+
+- its recording is played back headless from the seed,
+- a snapshot taken halfway through the playback is restored into a fresh Simulation that
+  carries on with the recorded inputs.
+
+Run from the repository root; exits with status 1 if any run diverges:
+
+    python -m benchmarks.determinism_check
+    python -m benchmarks.determinism_check --seeds 50 --ticks 3600
+"""
+import argparse
+import random
+import sys
+import tempfile
+
+DEFAULT_SEEDS = 20
+DEFAULT_TICKS = 1800  # 30 seconds of play per seed
+JUMP_CHANCE = 1 / 30  # Chance the bot jumps on a tick
+
+
+def play_recorded(seed, ticks, directory):
+    """Play one run with a bot, recording it; returns (simulation, path of the recording)."""
+    from core.replay import ReplayRecorder
+    from core.simulation import Simulation, INPUT_JUMP
+    from utils.constants import SIMULATION_TICK
+
+    simulation = Simulation(seed=seed)
+    recorder = ReplayRecorder(directory, simulation.seed)
+    bot = random.Random(seed)
+    while not simulation.game_over and simulation.tick < ticks:
+        inputs = [INPUT_JUMP] if bot.random() < JUMP_CHANCE else []
+        simulation.step(SIMULATION_TICK, inputs)
+        recorder.record(simulation.tick, inputs)
+    recorder.finish(simulation.tick, simulation.score)
+    return simulation, recorder.path
+
+
+def check_seed(seed, ticks, directory):
+    """Return the differences found for one seed, as (check, detail) pairs."""
+    from core.replay import load_replay, play_headless
+    from core.simulation import Simulation
+    from core.snapshot import take_snapshot, restore_snapshot
+
+    original, path = play_recorded(seed, ticks, directory)
+    expected = take_snapshot(original)
+    replay = load_replay(path)
+    dt = 1 / replay.ticks_per_second
+
+    # Keep a snapshot from halfway through the playback to restore below
+    snapshot_tick = max(replay.last_tick // 2, 1)
+    halfway = []
+
+    def on_step(simulation, events):
+        if simulation.tick == snapshot_tick:
+            halfway.append(take_snapshot(simulation))
+
+    replayed = play_headless(replay, on_step)
+    restored = Simulation(seed=seed + 1)  # Everything it starts with must be overwritten
+    if halfway:
+        restore_snapshot(restored, halfway[0])
+        while not restored.game_over and restored.tick < replay.last_tick:
+            restored.step(dt, replay.inputs_for(restored.tick + 1))
+
+    differences = []
+    for check, simulation in (("replay", replayed), ("snapshot", restored)):
+        if (simulation.tick, simulation.score) != (original.tick, original.score):
+            differences.append((check, f"tick {simulation.tick} score {simulation.score!r}, "
+                                       f"expected tick {original.tick} score {original.score!r}"))
+        elif take_snapshot(simulation) != expected:
+            differences.append((check, "same tick and score, but the world state differs"))
+    return original, differences
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check that ComeHome runs replay and restore exactly.")
+    parser.add_argument("--seeds", type=int, default=DEFAULT_SEEDS, help="Seeds to play")
+    parser.add_argument("--ticks", type=int, default=DEFAULT_TICKS, help="Most ticks per run")
+    args = parser.parse_args(argv)
+
+    directory = tempfile.mkdtemp(prefix="comehome-determinism-")
+    failures = 0
+    for seed in range(args.seeds):
+        original, differences = check_seed(seed, args.ticks, directory)
+        status = "ok" if not differences else "DIVERGED"
+        print(f"seed {seed}: {status} (tick {original.tick}, score {original.score:.3f})", file=sys.stderr)
+        for check, detail in differences:
+            print(f"  {check}: {detail}", file=sys.stderr)
+        failures += bool(differences)
+
+    print(f"{args.seeds - failures}/{args.seeds} seeds deterministic", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
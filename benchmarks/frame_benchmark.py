@@ -0,0 +1,337 @@
+"""Frame-time benchmarks for the gameplay loop.
+
+Drives GameWindow with scripted jumps, forced entity densities and forced running speeds, and
+reports per-phase p50/p95/p99 timings, allocations per tick and Python lines executed per tick
+as JSON.
+
+Run from the repository root:
+
+    python -m benchmarks.frame_benchmark
+    python -m benchmarks.frame_benchmark --scenario density_1000 --ticks 300
+    python -m benchmarks.frame_benchmark --output results.json --baseline benchmarks/baseline.json
+    python -m benchmarks.frame_benchmark --save-baseline benchmarks/baseline.json
+
+Rendering goes to an invisible offscreen (EGL) window, so no display or GPU is needed. Pass
+--no-render to skip drawing entirely on machines without any OpenGL driver.
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+
+import pyglet
+
+# Scripted scenarios: forced running speed, entities kept alive per type and jump timings
+SCENARIOS = {
+    "baseline_run": {"running_speed": 200, "density": None, "jump_every": 45},
+    "density_10": {"running_speed": 1000, "density": 10, "jump_every": 45},
+    "density_100": {"running_speed": 1000, "density": 100, "jump_every": 45},
+    "density_1000": {"running_speed": 1000, "density": 1000, "jump_every": 45},
+    "top_speed": {"running_speed": "max", "density": None, "jumps": [10, 18, 70, 130, 136, 200]},
+}
+
+# Phases timed on the simulation and on the view
+SIMULATION_PHASES = [
+    "update_player", "update_obstacles", "update_coins", "update_bugs",
+    "remove_expired", "spawn_periodic_objects", "handle_collisions",
+]
+VIEW_PHASES = ["handle_events", "sync_sprites", "sync_bug_sprites"]
+
+# A phase regresses when its p95 is this much slower than the baseline
+REGRESSION_THRESHOLD = 1.25
+
+# Extra ticks run under a line tracer to count the game's Python-level work per tick; unlike
+# timings, the count is exact and the same on every machine
+LINE_COUNT_TICKS = 30
+GAME_PACKAGES = ("core", "entities", "utils")
+
+
+class HeadlessWindow:
+    """Bare stand-in for arcade.Window when no OpenGL driver is available."""
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.background_color = (0, 0, 0)
+
+    def show_view(self, view):
+        pass
+
+
+def open_window(render):
+    """Create an invisible offscreen window, or a stub that only supports updates."""
+    from utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+    if render:
+        pyglet.options["headless"] = True
+        import arcade
+        return arcade.Window(SCREEN_WIDTH, SCREEN_HEIGHT, "ComeHome benchmark", visible=False)
+
+    import arcade
+    import arcade.window_commands
+    window = HeadlessWindow(SCREEN_WIDTH, SCREEN_HEIGHT)
+    arcade.get_window = arcade.window_commands.get_window = lambda: window
+    return window
+
+
+class PhaseTimer:
+    """Collects per-tick durations of named phases by wrapping bound methods."""
+    def __init__(self):
+        self.samples = {}
+        self.current = {}
+
+    def wrap(self, owner, method_name, phase=None):
+        phase = phase or method_name
+        method = getattr(owner, method_name)
+        self.samples.setdefault(phase, [])
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.current[phase] = self.current.get(phase, 0.0) + time.perf_counter() - start
+
+        setattr(owner, method_name, timed)
+
+    def end_tick(self):
+        for phase, samples in self.samples.items():
+            samples.append(self.current.get(phase, 0.0))
+        self.current = {}
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def summarize(samples):
+    """Return p50/p95/p99/mean/max of a list of durations, in milliseconds."""
+    values = sorted(samples)
+    return {
+        "p50_ms": percentile(values, 0.50) * 1000,
+        "p95_ms": percentile(values, 0.95) * 1000,
+        "p99_ms": percentile(values, 0.99) * 1000,
+        "mean_ms": (sum(values) / len(values) * 1000) if values else 0.0,
+        "max_ms": (values[-1] * 1000) if values else 0.0,
+    }
+
+
+def top_up(view, density):
+    """Spawn entities spread across the screen until every type reaches the forced density."""
+    from utils.constants import SCREEN_WIDTH
+    simulation = view.simulation
+    spawners = [
+        (simulation.obstacles, simulation.spawn_obstacle),
+        (simulation.coins, simulation.spawn_coin),
+    ]
+    simulation.events = []
+    for entities, spawn in spawners:
+        while len(entities) < density:
+            spawn()
+            entities[-1].x = entities[-1].prev_x = simulation.rng.uniform(0, SCREEN_WIDTH + 200)
+        entities.sort(key=lambda entity: entity.x)  # The simulation keeps these lists sorted by x
+    view.handle_events(simulation.events)
+
+    swarm = simulation.bugs
+    if len(swarm) < density:
+        missing = density - len(swarm)
+        swarm.spawn(missing, x=swarm.rng.uniform(0, SCREEN_WIDTH + 200, missing))
+    simulation.events = []
+
+
+def drive_tick(view, config, tick):
+    """Apply the scenario's forced density and scripted jump for one tick."""
+    import arcade
+    if config["density"]:
+        top_up(view, config["density"])
+    jump_every = config.get("jump_every")
+    if tick in config.get("jumps", ()) or (jump_every and tick % jump_every == 0):
+        view.on_key_press(arcade.key.SPACE, 0)
+
+
+def count_python_lines(view, config, first_tick, ticks=LINE_COUNT_TICKS):
+    """Return the mean number of game-code lines executed by one on_update.
+
+    Only lines in the game's own packages are counted, not arcade or pyglet internals.
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    prefixes = tuple(os.path.join(root, package) + os.sep for package in GAME_PACKAGES)
+    lines = 0
+
+    def trace_lines(frame, event, arg):
+        nonlocal lines
+        if event == "line":
+            lines += 1
+        return trace_lines
+
+    def trace_calls(frame, event, arg):
+        return trace_lines if frame.f_code.co_filename.startswith(prefixes) else None
+
+    for tick in range(first_tick, first_tick + ticks):
+        drive_tick(view, config, tick)
+        sys.settrace(trace_calls)
+        try:
+            view.on_update(1 / 60)
+        finally:
+            sys.settrace(None)
+    return lines / ticks
+
+
+def run_scenario(window, name, config, ticks, render):
+    """Drive a fresh GameWindow through one scenario and return its report."""
+    from core.game_window import GameWindow
+    from utils.sound_bank import sound_bank
+
+    view = GameWindow(seed=1234)
+    view.setup()
+    if render:
+        window.show_view(view)
+
+    simulation = view.simulation
+    simulation.invulnerable = True  # Keep the run alive for the whole scenario
+    simulation.speed_increase_rate = 0
+    speed = simulation.max_running_speed if config["running_speed"] == "max" else config["running_speed"]
+    simulation.running_speed = speed
+
+    timer = PhaseTimer()
+    for phase in SIMULATION_PHASES:
+        timer.wrap(simulation, phase)
+    for phase in VIEW_PHASES:
+        timer.wrap(view, phase)
+    timer.wrap(view.ground, "update", "ground_update")
+
+    tick_samples = []
+    draw_samples = []
+    block_deltas = []
+    pools = list(view.pools.values()) + [view.bug_pool]
+    allocated_before = sum(pool.allocated for pool in pools)
+    gc_before = sum(stat["collections"] for stat in gc.get_stats())
+
+    for tick in range(ticks):
+        drive_tick(view, config, tick)
+
+        blocks = sys.getallocatedblocks()
+        start = time.perf_counter()
+        view.on_update(1 / 60)
+        tick_samples.append(time.perf_counter() - start)
+        block_deltas.append(sys.getallocatedblocks() - blocks)
+
+        if render:
+            start = time.perf_counter()
+            view.on_draw()
+            window.ctx.finish()
+            draw_samples.append(time.perf_counter() - start)
+
+        timer.end_tick()
+
+    phases = {"on_update": summarize(tick_samples)}
+    for phase, samples in timer.samples.items():
+        phases[phase] = summarize(samples)
+    if render:
+        phases["on_draw"] = summarize(draw_samples)
+
+    report = {
+        "config": config,
+        "ticks": ticks,
+        "entities": {
+            "obstacles": len(simulation.obstacles),
+            "coins": len(simulation.coins) + len(simulation.magnet_coins),
+            "lightning_bugs": len(simulation.bugs),
+        },
+        "phases": phases,
+        "allocations": {
+            "sprites_per_tick": (sum(pool.allocated for pool in pools) - allocated_before) / ticks,
+            "net_blocks_per_tick": sum(block_deltas) / ticks,
+            "gc_collections": sum(stat["collections"] for stat in gc.get_stats()) - gc_before,
+        },
+        "pools": view.get_pool_stats(),
+        "background": view.background.get_stats(),
+        "animations": view.animations.get_stats(),
+        "sounds": sound_bank.get_memory_report(),
+    }
+    # Counted after everything else is measured, since tracing is slow and allocates
+    report["python_lines_per_tick"] = count_python_lines(view, config, ticks)
+    return report
+
+
+def compare(results, baseline, threshold=REGRESSION_THRESHOLD):
+    """Return (scenario, phase, baseline p95, current p95, ratio) for each phase slower than the baseline."""
+    regressions = []
+    for name, scenario in results["scenarios"].items():
+        base_scenario = baseline.get("scenarios", {}).get(name)
+        if not base_scenario:
+            continue
+        for phase, stats in scenario["phases"].items():
+            base_stats = base_scenario["phases"].get(phase)
+            if not base_stats or base_stats["p95_ms"] <= 0:
+                continue
+            ratio = stats["p95_ms"] / base_stats["p95_ms"]
+            if ratio > threshold:
+                regressions.append((name, phase, base_stats["p95_ms"], stats["p95_ms"], ratio))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the ComeHome gameplay loop.")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="Scenario to run (repeatable, defaults to all)")
+    parser.add_argument("--ticks", type=int, default=600, help="Ticks per scenario")
+    parser.add_argument("--no-render", action="store_true", help="Skip drawing (no OpenGL needed)")
+    parser.add_argument("--output", help="Write the JSON report to this file instead of stdout")
+    parser.add_argument("--baseline", help="Compare p95 timings against this JSON report")
+    parser.add_argument("--save-baseline", help="Also write the report to this baseline file")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD,
+                        help="p95 ratio above which a phase counts as a regression")
+    args = parser.parse_args(argv)
+
+    # Keep coins picked up during the scenarios out of the player's real profile: the views
+    # import the shared store on first use, so swap in one of our own before any of them load
+    import utils.profile_store
+    utils.profile_store.profile_store = utils.profile_store.ProfileStore(tempfile.mkdtemp(prefix="comehome-benchmark-"))
+
+    render = not args.no_render
+    window = open_window(render)
+    names = args.scenario or list(SCENARIOS)
+
+    results = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "render": render,
+            "ticks": args.ticks,
+        },
+        "scenarios": {},
+    }
+    for name in names:
+        print(f"Running {name}...", file=sys.stderr)
+        results["scenarios"][name] = run_scenario(window, name, SCENARIOS[name], args.ticks, render)
+
+    report = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(report + "\n")
+    else:
+        print(report)
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as file:
+            file.write(report + "\n")
+
+    if args.baseline:
+        with open(args.baseline, "r") as file:
+            baseline = json.load(file)
+        regressions = compare(results, baseline, args.threshold)
+        for name, phase, before, after, ratio in regressions:
+            print(f"REGRESSION {name}/{phase}: p95 {before:.3f} ms -> {after:.3f} ms ({ratio:.2f}x)", file=sys.stderr)
+        if regressions:
+            return 1
+        print("No regressions against the baseline.", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,36 @@
+from bisect import bisect_left, bisect_right
+from operator import attrgetter
+
+# Every world object scrolls left at the same speed and spawns at the right edge, so lists kept
+# in spawn order are also sorted by x. The player never moves horizontally, which means the
+# only candidates for hit tests and magnet queries sit in one narrow x-interval of those lists.
+_get_x = attrgetter("x")
+_get_prev_x = attrgetter("prev_x")
+
+
+def x_range(entities, x_min, x_max):
+    """Return (start, end) so that entities[start:end] are the ones with x_min <= x <= x_max.
+
+    ``entities`` must be sorted by x. Costs O(log n) no matter how many entities there are.
+    """
+    start = bisect_left(entities, x_min, key=_get_x)
+    end = bisect_right(entities, x_max, lo=start, key=_get_x)
+    return start, end
+
+
+def swept_x_range(entities, x_min, x_max):
+    """Return (start, end) so that entities[start:end] are the ones that crossed [x_min, x_max] in the last step.
+
+    An entity qualifies if it started the step at or right of x_min and ended it at or left of
+    x_max. Everything scrolls by the same amount per step, so the list is sorted by prev_x too.
+    """
+    start = bisect_left(entities, x_min, key=_get_prev_x)
+    end = bisect_right(entities, x_max, lo=start, key=_get_x)
+    return start, end
+
+
+def reach(player_x, player_box, entity_box, scale=1.0):
+    """Return the x-interval where an entity's center can overlap the player's hit box."""
+    player_left, player_right, _, _ = player_box
+    left, right, _, _ = entity_box
+    return player_x + player_left - right * scale, player_x + player_right - left * scale
@@ -1,160 +1,282 @@
+import os
 import arcade
-from utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, GROUND_HEIGHT, OBSTACLE_SPAWN_RATE, BUG_MAX_COUNT, BUG_MIN_COUNT, BUG_SCALE, BUG_SPEED
+from utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, GROUND_HEIGHT, BUG_SCALE
+from utils.constants import OBSTACLE_POOL_SIZE, COIN_POOL_SIZE, BUG_POOL_SIZE, SIMULATION_TICK, MAX_SIMULATION_STEPS
+from utils.pool import EntityPool
+from utils.parallax import ParallaxBackground
+from utils.overlay import Overlay
+from utils.animation import AnimationSystem
+from utils.sound_bank import sound_bank
+from utils.profile_store import profile_store
+from utils.timers import timers
+from utils.profiler import profiler
+from utils.view_registry import views
 from entities.player import Player
 from entities.obstacle import Obstacle
 from entities.ground import Ground
 import random
 from entities.coin import Coin
-import os
 from entities.lightning_bug import LightningBug
+from entities.lightning_bug_swarm import BUG_FRAME_COUNT
+from core.replay import ReplayRecorder, REPLAY_SUBDIRECTORY
+from core.snapshot import take_snapshot, restore_snapshot, write_snapshot, SUSPEND_FILE
+from core.simulation import Simulation, INPUT_JUMP, EVENT_SPAWN, EVENT_DESPAWN, EVENT_JUMP, EVENT_COIN_COLLECTED, EVENT_GAME_OVER
+import numpy as np
 import pyglet
 
 
 class GameWindow(arcade.View):
-    def __init__(self):
+    """Renders a Simulation and plays its sounds; the game rules live in core.simulation."""
+    def __init__(self, seed=None, replay=None):
         super().__init__()
         arcade.set_background_color(arcade.color.SKY_BLUE)
         self.player = None
         self.ground = None
         self.obstacles = None
 
-        # Initialize the score
-        self.score = 0
-        self.running_speed = 200  # Player's initial running speed in pixels per second
-        self.pixels_to_meters = 0.1  # Conversion factor: 10 pixels = 1 meter
-        self.speed_increase_rate = 1  # Pixels per second increase every second
-        self.max_running_speed = 5000  # Optional: Maximum running speed
-
-        # Initialize scores
-        self.scores = []
-        self.load_scores()
-        self.time_since_last_obstacle = 0
-        self.time_since_last_coin = 0
-        self.time_since_last_bug = 0
+        # Headless game rules; this view only renders them
+        self.seed = replay.seed if replay is not None else seed
+        self.replay = replay  # Recording whose inputs drive the run instead of the keyboard
+        self.recorder = None  # Records this run's seed and inputs
+        self.simulation = None
+        self.start_speed = None  # Running speed set while there is no run, applied when one starts
+        self.pending_inputs = []  # Inputs received since the last simulation step
+        self.accumulator = 0.0  # Frame time not yet consumed by fixed simulation ticks
+        self.entity_sprites = {}  # Simulation entity id -> sprite drawn for it
+        self.start_snapshot = None  # World snapshot of the run's first tick, rewound to by retry()
+
         self.game_over = False
 
         self.coins = arcade.SpriteList()
         self.lightning_bugs = arcade.SpriteList()
-        self.total_coins_collected = 0
+        self.bug_sprites = []  # Sprite drawing the swarm bug at the same index
+        self.bug_frames_shown = np.zeros(0, dtype=np.int64)  # Frame each bug sprite displays, -1 if unknown
 
         # Background layers
-        self.background_layers = []
+        self.background = None
         self.background_speeds = [0.2, 0.5, 1.0, 2.0]  # Parallax speeds
-        self.background_offsets = [0, 0, 0, 0]  # Track each layer's horizontal offset
+
+        # HUD
+        self.overlay = None
 
         # Background sound
-        self.background_sound = None
+        self.background_sound_player = None
         
         # Initialize the wind sound timer and interval
         self.wind_sound_timer = 0
         self.next_wind_interval = random.uniform(10, 25)  # 10 to 25 seconds
         self.wind_sound = None
         self.wind_sound_playing = False
+        self.wind_timer = None  # Pending timer of the next wind gust
+        self.dialogue_timer = None  # Pending timer of the level dialogue
 
         # Running sound
-        self.running_sound = None
         self.running_sound_playing = False  # Track if the sound is already playing
         self.running_sound_player = None  # Playback instance for the running sound
 
-        # Dialogue sound
-        self.level_dialogue = None
 
     ################################################################################################
     # Initialization and Setup
     ################################################################################################
     def setup(self):
-        """Setup the game and initialize objects."""       
-        # Initialize game objects
-        self.ground = Ground()
+        """Setup the game and initialize objects."""
+        self.build()
+        self.start_run()
+
+    def reset(self, seed=None, replay=None, snapshot=None):
+        """Registry hook: start a fresh run, or carry on from a world snapshot.
+
+        The view's resources are built on the first visit only.
+        """
+        self.replay = replay
+        self.seed = replay.seed if replay is not None else seed
+        if self.ground is None:
+            self.build()
+        else:
+            self.clear_run()
+        if snapshot is not None:
+            try:
+                self.resume_run(snapshot)
+                return
+            except Exception as e:
+                print(f"Error restoring world snapshot, starting a new run: {e}")
+        self.start_run()
+
+    def build(self):
+        """Create everything that outlives a single run: sprites, pools, background and HUD."""
+        self.animations = AnimationSystem()  # Shared clocks for the ground, obstacle and coin animations
+        self.ground = Ground(self.animations)
         self.player = Player()
         self.obstacles = arcade.SpriteList()
-        
-        # Load the total coins collected
-        self.load_total_coins()
+
+        # Pools of reusable world sprites so steady-state gameplay allocates nothing
+        self.obstacle_pool = EntityPool(lambda: Obstacle(0, 0), OBSTACLE_POOL_SIZE)
+        self.coin_pool = EntityPool(lambda: Coin(0, 0), COIN_POOL_SIZE)
+        self.bug_pool = EntityPool(lambda: LightningBug(0, 0, scale=BUG_SCALE), BUG_POOL_SIZE)
+        self.pools = {"obstacle": self.obstacle_pool, "coin": self.coin_pool}
+        self.sprite_lists = {"obstacle": self.obstacles, "coin": self.coins}
 
         # Load background layers
-        for i in range(1, 5):  # Load Background1.png to Background4.png
-            layer = arcade.load_texture(f"assets/images/background/Background{i}.png")
-            self.background_layers.append(layer)
-            
+        self.background = ParallaxBackground(self.background_speeds, SCREEN_WIDTH, SCREEN_HEIGHT)
+
+        # Distance counter
+        self.overlay = Overlay()
+        self.overlay.add_text("distance", "Distance: 0 m", 10, SCREEN_HEIGHT - 30, arcade.color.WHITE, 20)
+
+    def start_run(self):
+        """Start a new run on the view's resources."""
+        self.simulation = Simulation(seed=self.seed)
+        if self.start_speed is not None:
+            self.simulation.running_speed = self.start_speed
+            self.start_speed = None
+        if self.replay is None:
+            replay_directory = os.path.join(profile_store.directory, REPLAY_SUBDIRECTORY)
+            self.recorder = ReplayRecorder(replay_directory, self.simulation.seed)
+        self.overlay.set_text("distance", "Distance: 0 m")
+
         # Play the background sound
         self.play_background_sound()
         self.play_wind_sound()
         
         # Schedule level dialogue to play with a delay
-        arcade.schedule(self.delayed_play_level_dialogue, 1.0)  # 1-second delay
+        self.dialogue_timer = timers.schedule_once(self.delayed_play_level_dialogue, 1.0, owner=self)  # 1-second delay
+
+        # Retrying rewinds to here instead of building a new run
+        self.start_snapshot = self.snapshot()
+
+    def resume_run(self, snapshot):
+        """Carry on a run from a world snapshot, restored in place into the view's simulation."""
+        if self.simulation is None:
+            self.simulation = Simulation()
+        timer_state = restore_snapshot(self.simulation, snapshot)
+        self.seed = self.simulation.seed
+        if self.simulation.tick == 0:
+            self.start_snapshot = snapshot
+            if self.replay is None:
+                replay_directory = os.path.join(profile_store.directory, REPLAY_SUBDIRECTORY)
+                self.recorder = ReplayRecorder(replay_directory, self.seed)
+        else:
+            self.start_snapshot = None  # Recordings start at tick 0, so a resumed run is not recorded
+
+        # Sprites for the restored world
+        simulation = self.simulation
+        for entity in simulation.obstacles + simulation.coins + simulation.magnet_coins:
+            self.spawn_sprite(entity)
+        self.sync_sprites()
+        self.overlay.set_text("distance", f"Distance: {round(self.score)} m")
 
-        # Load the running sound
+        self.play_background_sound()
+        self.play_wind_sound(timer_state.get("wind"))
+        if "dialogue" in timer_state:
+            self.dialogue_timer = timers.schedule_once(
+                self.delayed_play_level_dialogue, timer_state["dialogue"], owner=self
+            )
+
+    def retry(self):
+        """Rewind to the start of the run, with the same seed, without rebuilding anything."""
+        if self.replay is not None:
+            return
+        start_snapshot = self.start_snapshot
+        self.seed = self.simulation.seed
+        self.clear_run()
+        if start_snapshot is not None:
+            self.resume_run(start_snapshot)
+        else:
+            self.start_run()
+
+    def snapshot(self):
+        """Return a world snapshot of the run, including its wind and dialogue timers."""
+        timer_state = {}
+        for name, timer in (("wind", self.wind_timer), ("dialogue", self.dialogue_timer)):
+            left = timers.time_left(timer) if timer is not None else None
+            if left is not None:
+                timer_state[name] = left
+        return take_snapshot(self.simulation, timer_state)
+
+    def suspend(self):
+        """Save a run in progress to disk so the next launch can resume it."""
+        if self.replay is not None or self.simulation is None or self.game_over:
+            return
+        path = os.path.join(profile_store.directory, SUSPEND_FILE)
         try:
-            self.running_sound = arcade.Sound("assets/sounds/characters/running.wav")
+            write_snapshot(path, self.snapshot())
+            print(f"Run suspended to {path}")
         except Exception as e:
-            print(f"Error loading running sound: {e}")
-            
-    def delayed_play_level_dialogue(self, delta_time):
+            print(f"Error suspending run: {e}")
+
+    def clear_run(self):
+        """Return the last run's sprites to their pools and forget its state."""
+        timers.cancel_owner(self)
+        self.stop_run_sounds()
+        if self.recorder is not None:
+            self.recorder.close()
+            self.recorder = None
+
+        simulation = self.simulation
+        for entity in simulation.obstacles + simulation.coins + simulation.magnet_coins:
+            self.despawn_sprite(entity)
+        for sprite in self.bug_sprites:
+            self.lightning_bugs.remove(sprite)
+            self.bug_pool.release(sprite)
+        self.bug_sprites = []
+        self.bug_frames_shown = np.zeros(0, dtype=np.int64)
+
+        self.player.reset()
+        self.pending_inputs = []
+        self.accumulator = 0.0
+        self.game_over = False
+        self.wind_sound_playing = False
+        self.wind_timer = None
+        self.dialogue_timer = None
+
+    def on_show_view(self):
+        """Let the run's timers continue, e.g. when coming back from the pause menu."""
+        timers.resume(self)
+
+    def on_hide_view(self):
+        """Freeze the run's timers while another view is shown."""
+        if not self.game_over:  # A finished run has already cancelled its timers
+            timers.pause(self)
+
+    def delayed_play_level_dialogue(self):
         """Play the dialogue sound after a delay."""
-        try:
-            self.level_dialogue = arcade.Sound("assets/sounds/characters/dialogue/Level1_1.wav")
-            self.level_dialogue.play(volume=2)
-            # print("Level dialogue started.")
-        except Exception as e:
-            print(f"Error playing level dialogue: {e}")
-        finally:
-            # Cancel further scheduling of this method
-            arcade.unschedule(self.delayed_play_level_dialogue)
+        sound_bank.play("level1_dialogue", volume=2)
             
     def play_background_sound(self):
-        """Play and loop the background sound and periodically play wind sound."""
-        try:
-            # Play and loop the forest background sound
-            self.background_sound = arcade.Sound("assets/sounds/background/forest_noises.wav")
-            self.background_sound_player = self.background_sound.play(loop=True, volume=1)
-        except Exception as e:
-            print(f"Error playing background sound: {e}")
+        """Play and loop the forest background sound."""
+        self.background_sound_player = sound_bank.play("forest_noises", volume=1, loop=True)
 
-        # Ensure the wind sound is loaded
-        try:
-            self.wind_sound = arcade.Sound("assets/sounds/background/wind.wav")
-            self.wind_sound_player = None  # To track if wind sound is playing
-        except Exception as e:
-            print(f"Error loading wind sound: {e}")
-            self.wind_sound = None
 
+    # Schedule wind sound playback
+    def play_wind_sound(self, delay=None):
+        """Periodically play the wind sound at random intervals, the first one after delay if given."""
+        self.wind_sound = sound_bank.get("wind")
 
-    # Schedule wind sound playbackdef play_wind_sound(self):
-    def play_wind_sound(self):
-        """Periodically play the wind sound at random intervals."""
-        try:
-            # Ensure the wind sound is loaded
-            self.wind_sound = arcade.Sound("assets/sounds/background/wind.wav")
-        except Exception as e:
-            print(f"Error loading wind sound: {e}")
-            self.wind_sound = None
-
-        def play_wind(delta_time):
+        def play_wind():
             """Play the wind sound if it's not already playing."""
             if not self.wind_sound_playing and self.wind_sound is not None:
                 try:
                     print("Wind sound starting...")
-                    self.wind_sound.play()
+                    sound_bank.play("wind")
                     self.wind_sound_playing = True
                     # Schedule flag reset after sound duration
                     sound_duration = self.wind_sound.get_length()
-                    arcade.schedule(reset_wind_sound_flag, sound_duration)
+                    timers.schedule_once(reset_wind_sound_flag, sound_duration, owner=self)
                 except Exception as e:
                     print(f"Error playing wind sound: {e}")
 
-            # Schedule the next wind sound after a random interval
+            # Schedule the next wind sound after a random interval; only one is ever pending
             next_interval = random.uniform(10, 25)
-            arcade.schedule(play_wind, next_interval)
+            self.wind_timer = timers.schedule_once(play_wind, next_interval, owner=self)
 
-        def reset_wind_sound_flag(delta_time):
+        def reset_wind_sound_flag():
             """Reset the wind sound playing flag."""
             print("Wind sound stopping...")
             self.wind_sound_playing = False
-            arcade.unschedule(reset_wind_sound_flag)
 
         # Initial scheduling
-        arcade.schedule(play_wind, random.uniform(10, 25))
+        first_interval = random.uniform(10, 25) if delay is None else delay
+        self.wind_timer = timers.schedule_once(play_wind, first_interval, owner=self)
 
     ################################################################################################
     # Rendering
@@ -164,23 +286,24 @@ class GameWindow(arcade.View):
         self.clear()
 
         # Draw background layers
-        for i, layer in enumerate(self.background_layers):
-            offset = self.background_offsets[i] % SCREEN_WIDTH
-            arcade.draw_lrwh_rectangle_textured(-offset, 0, SCREEN_WIDTH, SCREEN_HEIGHT, layer)
-            arcade.draw_lrwh_rectangle_textured(SCREEN_WIDTH - offset, 0, SCREEN_WIDTH, SCREEN_HEIGHT, layer)
+        with profiler.scope("draw_background"):
+            self.background.draw()
 
-        # Draw lightning bugs
-        self.lightning_bugs.draw()
+        with profiler.scope("draw_world"):
+            # Draw lightning bugs
+            self.lightning_bugs.draw()
 
-        # Render game objects
-        self.ground.draw()
-        self.player.draw()
-        self.obstacles.draw()
-        self.coins.draw()
+            # Render game objects
+            self.ground.draw()
+            self.player.draw()
+            self.obstacles.draw()
+            self.coins.draw()
 
-        # Draw distance (score) in meters
-        rounded_score = round(self.score)
-        arcade.draw_text(f"Distance: {rounded_score} m", 10, SCREEN_HEIGHT - 30, arcade.color.WHITE, 20)
+        # Draw distance (score) in meters; the label is only re-laid out when the rounded value changes
+        with profiler.scope("draw_hud"):
+            rounded_score = round(self.score)
+            self.overlay.set_text("distance", f"Distance: {rounded_score} m")
+            self.overlay.draw()
 
     ################################################################################################
     # Game Updates
@@ -188,105 +311,167 @@ class GameWindow(arcade.View):
     def on_update(self, delta_time):
         """Update game state."""
         if self.game_over:
-            # print("Game over reached. Saving coins...")
-            
             # Stop the running sound if it's playing
             if self.running_sound_playing:
                 # print("Stopping running sound due to game over.")
                 if self.running_sound_player:
-                    try:
-                        self.running_sound.stop(self.running_sound_player)  # Ensure sound is fully stopped
-                        # print("Running sound stopped due to game over.")
-                    except Exception as e:
-                        print(f"Error stopping running sound: {e}")
+                    sound_bank.stop("running", self.running_sound_player)  # Ensure sound is fully stopped
+                    self.running_sound_player = None
                 else:
                     print("No running sound instance to stop.")
                 
                 self.running_sound_playing = False  # Update after stopping the sound
-
-            # Save coins and return early
-            self.save_total_coins()  # Save total coins collected
             return
         
-        # Gradually increase the running speed
-        self.running_speed += self.speed_increase_rate * delta_time
-        if self.running_speed > self.max_running_speed:
-            self.running_speed = self.max_running_speed  # Cap the running speed
-        
-        # Update the distance score
-        self.score += self.running_speed * delta_time * self.pixels_to_meters
-
-        # Update background offsets
-        for i in range(len(self.background_layers)):
-            self.background_offsets[i] += self.background_speeds[i]
-
-        # Update ground tiles
-        ground_scroll_speed = 200  # Pixels per second
-        self.ground.update(delta_time, ground_scroll_speed)
+        # Advance the game rules in fixed ticks, however long this frame took
+        self.accumulator += delta_time
+        steps = 0
+        while self.accumulator >= SIMULATION_TICK:
+            if steps == MAX_SIMULATION_STEPS:
+                # Too far behind to catch up; drop the backlog instead of spiralling
+                self.accumulator = 0.0
+                break
+            inputs = self.pending_inputs
+            self.pending_inputs = []
+            if self.replay is not None:
+                inputs = self.replay.inputs_for(self.simulation.tick + 1)
+            with profiler.scope("simulation"):
+                events = self.simulation.step(SIMULATION_TICK, inputs)
+            if inputs and self.recorder is not None:
+                self.recorder.record(self.simulation.tick, inputs)
+            self.accumulator -= SIMULATION_TICK
+            steps += 1
+
+            # Create and recycle sprites, play sounds and handle the end of the run
+            with profiler.scope("handle_events"):
+                self.handle_events(events)
+            if self.game_over:
+                return
+
+        # How far the render time is between the last two simulation ticks
+        alpha = self.accumulator / SIMULATION_TICK
+
+        with profiler.scope("scroll"):
+            # Update background offsets (speeds are in pixels per 60 FPS frame)
+            self.background.scroll(delta_time * 60)
+
+            # Update ground tiles
+            ground_scroll_speed = 200  # Pixels per second
+            self.ground.update(delta_time, ground_scroll_speed)
+
+        # Move every sprite to its interpolated simulated position
+        with profiler.scope("sync_sprites"):
+            self.sync_sprites(alpha)
 
         # Check if the player is on the ground by comparing their center_y to the ground height
         is_on_ground = self.player.center_y <= GROUND_HEIGHT + self.player.height / 2 + 1  # Allow for a small margin
 
-        if not self.game_over and is_on_ground:
-            # Start running sound if not already playing
-            if not self.running_sound_playing and self.running_sound:
-                # print("Player is on the ground. Starting running sound.")
-                try:
-                    self.running_sound_player = self.running_sound.play(loop=True, volume=1)
-                    self.running_sound_playing = True
-                    # print("Running sound started.")
-                except Exception as e:
-                    print(f"Error playing running sound: {e}")
-        else:
-            # Stop running sound if the player is in the air or the game is over
-            if self.running_sound_playing:
-                # print("Stopping running sound. Player is not on the ground or game is over.")
-                if self.running_sound_player:
-                    try:
-                        self.running_sound.stop(self.running_sound_player)
+        with profiler.scope("audio"):
+            if not self.game_over and is_on_ground:
+                # Start running sound if not already playing
+                if not self.running_sound_playing:
+                    self.running_sound_player = sound_bank.play("running", volume=1, loop=True)
+                    self.running_sound_playing = self.running_sound_player is not None
+            else:
+                # Stop running sound if the player is in the air or the game is over
+                if self.running_sound_playing:
+                    if self.running_sound_player:
+                        sound_bank.stop("running", self.running_sound_player)
                         self.running_sound_player = None  # Clear the player instance
-                        # print("Running sound stopped.")
-                    except Exception as e:
-                        print(f"Error stopping running sound: {e}")
-                self.running_sound_playing = False
-
-        # Update player animation
-        self.player.update_animation(delta_time)
-
-        # Update game objects
-        self.player.update()
-        for obstacle in self.obstacles:
-            obstacle.update(self.running_speed)
-        for coin in self.coins:
-            coin.update(delta_time, self.player, self.running_speed)
-        self.lightning_bugs.update()
-
-        # Update animations for obstacles and bugs
-        for obstacle in self.obstacles:
-            obstacle.update_animation(delta_time)
-        for coin in self.coins:
-            coin.update_animation(delta_time)
-        for bug in self.lightning_bugs:
-            bug.update_animation(delta_time)
-
-        # Remove off-screen bugs
-        self.remove_off_screen_bugs()
-
-        # Spawn lightning bugs periodically
-        self.time_since_last_bug += delta_time
-        if self.time_since_last_bug > 1:  # Adjust spawn rate as needed
-            self.time_since_last_bug = 0
-            self.spawn_lightning_bug()
-
-        # Remove off-screen obstacles and coins
-        self.remove_off_screen_obstacles()
-        self.remove_off_screen_coins()
-
-        # Spawn obstacles and coins periodically
-        self.spawn_periodic_objects(delta_time)
+                    self.running_sound_playing = False
 
-        # Check for collisions with obstacles or coins
-        self.handle_collisions()
+        # Advance one clock per animation type (the bug swarm animates itself)
+        with profiler.scope("animation"):
+            self.player.update_animation(delta_time)
+            self.animations.advance(delta_time)
+
+        # Entity counts for the profiler's per-frame export
+        if profiler.enabled:
+            profiler.set_count("obstacles", len(self.simulation.obstacles))
+            profiler.set_count("coins", len(self.simulation.coins) + len(self.simulation.magnet_coins))
+            profiler.set_count("lightning_bugs", len(self.simulation.bugs))
+            profiler.set_count("sim_steps", steps)
+
+    @property
+    def score(self):
+        """Distance run so far, in meters."""
+        return self.simulation.score if self.simulation else 0
+
+    @property
+    def running_speed(self):
+        if self.simulation is None:
+            return self.start_speed or 0
+        return self.simulation.running_speed
+
+    @running_speed.setter
+    def running_speed(self, value):
+        if self.simulation is None:
+            self.start_speed = value  # No run yet: the next one starts at this speed
+        else:
+            self.simulation.running_speed = value
+
+    def sync_sprites(self, alpha=1.0):
+        """Place sprites between their previous and current simulated positions.
+
+        Every collection is walked once per frame, and each position is set in one assignment
+        so the sprite lists are updated once per sprite instead of once per axis.
+        """
+        player = self.simulation.player
+        self.player.position = (player.x, player.prev_y + (player.y - player.prev_y) * alpha)
+
+        sprites = self.entity_sprites
+        for obstacle in self.simulation.obstacles:
+            sprite = sprites[obstacle.id]
+            sprite.position = (obstacle.prev_x + (obstacle.x - obstacle.prev_x) * alpha, obstacle.y)
+        for coin in self.simulation.coins:
+            sprite = sprites[coin.id]
+            sprite.position = (
+                coin.prev_x + (coin.x - coin.prev_x) * alpha,
+                coin.prev_y + (coin.y - coin.prev_y) * alpha,
+            )
+        # Only gravitating coins change scale, so only they need it pushed to their sprites
+        for coin in self.simulation.magnet_coins:
+            sprite = sprites[coin.id]
+            sprite.position = (
+                coin.prev_x + (coin.x - coin.prev_x) * alpha,
+                coin.prev_y + (coin.y - coin.prev_y) * alpha,
+            )
+            sprite.set_display_scale(coin.scale)
+            sprite.gravitating = True
+
+        self.sync_bug_sprites(alpha)
+
+    def sync_bug_sprites(self, alpha):
+        """Push the swarm's positions and changed animation frames onto the bug sprites in one pass."""
+        swarm = self.simulation.bugs
+        count = len(swarm)
+
+        # Match the number of bug sprites to the number of live bugs
+        if len(self.bug_sprites) < count:
+            added = count - len(self.bug_sprites)
+            for _ in range(added):
+                sprite = self.bug_pool.acquire(0, 0)
+                self.bug_sprites.append(sprite)
+                self.lightning_bugs.append(sprite)
+            self.bug_frames_shown = np.concatenate((self.bug_frames_shown, np.full(added, -1, dtype=np.int64)))
+        while len(self.bug_sprites) > count:
+            sprite = self.bug_sprites.pop()
+            self.lightning_bugs.remove(sprite)
+            self.bug_pool.release(sprite)
+        self.bug_frames_shown = self.bug_frames_shown[:count]
+
+        xs, ys = swarm.positions(alpha)
+        for sprite, x, y in zip(self.bug_sprites, xs.tolist(), ys.tolist()):
+            sprite.position = (x, y)
+
+        # Only swap textures where the displayed frame actually changed
+        mirrored = swarm.facing_right()
+        bug_frames = swarm.live("frame")
+        frames = bug_frames + mirrored * BUG_FRAME_COUNT  # Mirrored frames get their own ids
+        changed = np.flatnonzero(frames != self.bug_frames_shown)
+        for i in changed.tolist():
+            self.bug_sprites[i].show_frame(int(bug_frames[i]), bool(mirrored[i]))
+        self.bug_frames_shown = frames
 
     ################################################################################################
     # Event Handlers
@@ -294,201 +479,96 @@ class GameWindow(arcade.View):
     def on_key_press(self, key, modifiers):
         """Handle key presses."""
         if key == arcade.key.SPACE:
-            self.player.jump()
+            self.pending_inputs.append(INPUT_JUMP)
+        elif key == arcade.key.R:
+            self.retry()
         elif key == arcade.key.ESCAPE:
             # Stop the running sound when opening the pause menu
             if self.running_sound_playing and self.running_sound_player:
-                try:
-                    self.running_sound.stop(self.running_sound_player)
-                    self.running_sound_player = None
-                    self.running_sound_playing = False
-                except Exception as e:
-                    print(f"Error stopping running sound when pausing: {e}")
+                sound_bank.stop("running", self.running_sound_player)
+                self.running_sound_player = None
+                self.running_sound_playing = False
 
-            from menus.pause import Pause
-            pause_menu = Pause(self)
-            self.window.show_view(pause_menu)
+            views.show("pause", game_view=self)
     ################################################################################################
     # Spawning World Assets
     ################################################################################################
-    def spawn_obstacle(self):
-        """Spawn a new animated obstacle."""
-        obstacle = Obstacle(SCREEN_WIDTH, GROUND_HEIGHT + 20)
-        self.obstacles.append(obstacle)
-
-    def spawn_coin(self):
-        """Spawn a coin at a random position."""
-        x = SCREEN_WIDTH  # Spawn at the right edge of the screen
-        y = GROUND_HEIGHT + random.randint(20, 100)  # Spawn near the ground with slight variation
-        coin = Coin(x, y)
-        self.coins.append(coin)
-        
-    def spawn_lightning_bug(self):
-        """Spawn multiple lightning bugs at random positions in the background."""
-        num_bugs = random.randint(BUG_MIN_COUNT, BUG_MAX_COUNT)
-        for _ in range(num_bugs):
-            x = SCREEN_WIDTH + random.randint(0, 200)
-            y = random.randint(SCREEN_HEIGHT // 2, SCREEN_HEIGHT - 50)
-            bug = LightningBug(x, y, scale=BUG_SCALE)
-            bug.change_x = BUG_SPEED
-            self.lightning_bugs.append(bug)
-
+    def spawn_sprite(self, entity):
+        """Take a pooled sprite for a newly simulated entity."""
+        sprite = self.pools[entity.kind].acquire(entity.x, entity.y)
+        self.sprite_lists[entity.kind].append(sprite)
+        self.entity_sprites[entity.id] = sprite
+        self.animations.add(sprite)
+
+    def despawn_sprite(self, entity):
+        """Return the sprite of a removed entity to its pool."""
+        sprite = self.entity_sprites.pop(entity.id)
+        self.animations.remove(sprite)
+        self.sprite_lists[entity.kind].remove(sprite)
+        self.pools[entity.kind].release(sprite)
 
     ################################################################################################
-    # Collision Handling
+    # Simulation Events
     ################################################################################################
-    def handle_collisions(self):
-        """Check and handle collisions with obstacles and coins."""
-        obstacles_hit = arcade.check_for_collision_with_list(self.player, self.obstacles)
-        coins_collected = arcade.check_for_collision_with_list(self.player, self.coins)
-
-        # Handle obstacle collisions
-        if obstacles_hit:
-            # print("Obstacle hit detected. Setting game over...")
-            self.game_over = True
-            
-            # Stop the background sound if it's playing
-            if self.background_sound_player:
-                try:
-                    self.background_sound.stop(self.background_sound_player)
-                    self.background_sound_player = None  # Clear the player instance
-                    print("Background sound stopped due to game over.")
-                except Exception as e:
-                    print(f"Error stopping background sound: {e}")
-
-            # Stop the running sound if it's playing
-            if self.running_sound_playing and self.running_sound_player:
-                try:
-                    self.running_sound.stop(self.running_sound_player)
-                    # print("Running sound stopped due to game over.")
-                except Exception as e:
-                    print(f"Error stopping running sound during game over: {e}")
-                self.running_sound_playing = False
-
-            # Add the current score to the scores list and save it
-            if self.score not in self.scores and round(self.score) not in self.scores:
-                rounded_score = round(self.score)
-                self.scores.append(rounded_score)
-
-            self.scores.sort(reverse=True)  # Sort scores in descending order
-            self.save_scores()
-
-            # Save coins before transitioning to the GameOver view
-            # print("Saving total coins before transitioning.")
-            self.save_total_coins()
-
-            # Transition to GameOver view
-            # print("Transitioning to GameOver view.")
-            from menus.game_over import GameOver
-            game_over_view = GameOver(self.score)
-            self.window.show_view(game_over_view)
-
-
-
-        # Handle coin collisions
-        for coin in coins_collected:
-            self.coins.remove(coin)  # Remove the coin from the sprite list
-            self.coin_collection = arcade.Sound('assets/sounds/game_sounds/coin_collection.wav')
-            self.coin_collection.play(volume=0.75) # Play the coin collection sound
-            self.total_coins_collected += 1  # Update the total coins collected
-            # print(f"Coin collected! Total coins: {self.total_coins_collected}")
-
-    def load_scores(self):
-        """Load the scores from a file."""
-        try:
-            with open("game_watcher/scores.txt", "r") as file:
-                self.scores = []
-                for line in file:
-                    stripped_line = line.strip()
-                    if stripped_line:  # Skip empty lines
-                        try:
-                            score = round(float(stripped_line))  # Handle floats gracefully
-                            self.scores.append(score)
-                        except ValueError:
-                            print(f"Skipping invalid score: {stripped_line}")
-        except FileNotFoundError:
-            self.scores = []  # Start with an empty list if the file doesn't exist
-            print("No scores file found. Starting fresh.")
-        except Exception as e:
-            print(f"Error loading scores: {e}")
-
-    def save_scores(self):
-        """Save the scores to a file."""
-        try:
-            os.makedirs("game_watcher", exist_ok=True)  # Ensure the directory exists
-
-            # Sanitize scores to ensure only rounded integers are written
-            self.scores = [round(score) for score in self.scores]
-            self.scores = sorted(set(self.scores), reverse=True)  # Sort and remove duplicates
-
-            # Write scores to file
-            with open("game_watcher/scores.txt", "w") as file:
-                for score in self.scores:
-                    file.write(f"{score}\n")
-                
-                # Remove the last score if there are more than 1 score
-                if len(self.scores) > 1:
-                    self.scores.pop()  # Remove the last score
-                
-            print("Scores saved successfully.")
-        except Exception as e:
-            print(f"Error saving scores: {e}")
+    def handle_events(self, events):
+        """React to simulation events with sprites, sounds and view transitions."""
+        for event, entity in events:
+            if event == EVENT_SPAWN:
+                self.spawn_sprite(entity)
+            elif event == EVENT_DESPAWN:
+                self.despawn_sprite(entity)
+            elif event == EVENT_JUMP:
+                with profiler.scope("audio"):
+                    sound_bank.play("jump")
+            elif event == EVENT_COIN_COLLECTED:
+                self.despawn_sprite(entity)
+                with profiler.scope("audio"):
+                    sound_bank.play("coin_collection", volume=0.75)  # Capped voices keep bursts cheap
+                if self.replay is None:
+                    with profiler.scope("save"):
+                        profile_store.add_coins(1)  # Written to disk in the background
+            elif event == EVENT_GAME_OVER:
+                self.end_run()
+
+    def end_run(self):
+        """Stop the run's sounds, save progress and move to the GameOver view."""
+        self.game_over = True
+        self.stop_run_sounds()
+
+        # The run's wind and dialogue timers end with it
+        timers.cancel_owner(self)
+
+        # Record the score; the profile store writes it to disk in the background
+        if self.replay is None:
+            with profiler.scope("save"):
+                profile_store.record_score(self.score)
+        if self.recorder is not None:
+            self.recorder.finish(self.simulation.tick, self.score)
+
+        # Transition to GameOver view
+        views.show("game_over", final_score=self.score)
+
+    def stop_run_sounds(self):
+        """Stop the forest background and running sounds."""
+        # Stop the background sound if it's playing
+        if self.background_sound_player:
+            sound_bank.stop("forest_noises", self.background_sound_player)
+            self.background_sound_player = None  # Clear the player instance
+            print("Background sound stopped due to game over.")
+
+        # Stop the running sound if it's playing
+        if self.running_sound_playing and self.running_sound_player:
+            sound_bank.stop("running", self.running_sound_player)
+            self.running_sound_player = None
+            self.running_sound_playing = False
 
     ################################################################################################
     # Utility Functions
     ################################################################################################
-    def remove_off_screen_bugs(self):
-        """Remove lightning bugs that are off-screen."""
-        for bug in self.lightning_bugs:
-            if bug.center_x < -bug.width:
-                self.lightning_bugs.remove(bug)
-
-    def remove_off_screen_obstacles(self):
-        """Remove obstacles that are off-screen and update score."""
-        for obstacle in self.obstacles:
-            if obstacle.center_x < -obstacle.width:
-                self.obstacles.remove(obstacle)
-                
-    def remove_off_screen_coins(self):
-        """Remove coins that are off-screen."""
-        for coin in self.coins:
-            if coin.center_x < -coin.width:
-                self.coins.remove(coin)
-
-    def spawn_periodic_objects(self, delta_time):
-        """Spawn obstacles and coins periodically based on running speed."""
-        # Adjust spawn intervals based on running speed
-        adjusted_obstacle_spawn_rate = OBSTACLE_SPAWN_RATE / (self.running_speed / 200)
-        adjusted_coin_spawn_rate = 1.0 / (self.running_speed / 200)  # Adjust as needed
-
-        # Spawn obstacles periodically
-        self.time_since_last_obstacle += delta_time
-        if self.time_since_last_obstacle > adjusted_obstacle_spawn_rate:
-            self.time_since_last_obstacle = 0
-            self.spawn_obstacle()
-
-        # Spawn coins periodically
-        self.time_since_last_coin += delta_time
-        if self.time_since_last_coin > adjusted_coin_spawn_rate:
-            self.time_since_last_coin = 0
-            self.spawn_coin()
-
-    def load_total_coins(self):
-        """Load the total number of coins collected from a file."""
-        try:
-            with open("game_watcher/total_coins.txt", "r") as file:
-                self.total_coins_collected = int(file.read().strip())
-        except FileNotFoundError:
-            self.total_coins_collected = 0  # Start at 0 if the file doesn't exist
-
-    def save_total_coins(self):
-        """Save the total number of coins collected to a file."""
-        try:
-            # Ensure the directory exists
-            os.makedirs("game_watcher", exist_ok=True)
-
-            # Save the total coins to a file
-            with open("game_watcher/total_coins.txt", "w") as file:
-                file.write(str(self.total_coins_collected))
-        except Exception as e:
-            print(f"Error saving total coins: {e}")
+    def get_pool_stats(self):
+        """Return the statistics of every entity pool."""
+        return {
+            "obstacles": self.obstacle_pool.get_stats(),
+            "coins": self.coin_pool.get_stats(),
+            "lightning_bugs": self.bug_pool.get_stats(),
+        }
@@ -0,0 +1,236 @@
+"""Run recordings: a seed plus the inputs applied on each simulation tick.
+
+The simulation is deterministic for a given seed and input stream, so that is all a run needs
+to be re-simulated exactly, in the game window or headless at many times real speed.
+
+Play a recording back from the repository root:
+
+    python -m core.replay game_watcher/replays/<file>.replay
+    python -m core.replay game_watcher/replays/<file>.replay --window
+    python -m core.replay game_watcher/replays/<file>.replay --profile
+
+File layout (little endian):
+    header  "CHRP", format version (u8), seed (u64), ticks per second (u16)
+    record  tick delta since the previous record (varint), input code (u8)
+    end     tick delta (varint), END_CODE (u8), final score (f64)
+
+Records are appended and flushed as they happen, so a run that crashed still leaves every
+input up to the crash; only the end record is missing.
+"""
+import argparse
+import os
+import struct
+import time
+from utils.constants import SIMULATION_TICK
+
+MAGIC = b"CHRP"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sBQH")
+SCORE = struct.Struct("<d")
+
+# Input codes; must stay stable across versions so old recordings keep playing
+INPUT_CODES = {"jump": 1}
+INPUT_NAMES = {code: name for name, code in INPUT_CODES.items()}
+END_CODE = 0xFF
+
+# Recordings live next to the player's profile, and only the newest are kept
+REPLAY_SUBDIRECTORY = "replays"
+MAX_REPLAYS = 50
+
+
+def encode_varint(value):
+    data = bytearray()
+    while value >= 0x80:
+        data.append((value & 0x7F) | 0x80)
+        value >>= 7
+    data.append(value)
+    return bytes(data)
+
+
+def decode_varint(data, position):
+    """Return (value, next position)."""
+    value = 0
+    shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, position
+        shift += 7
+
+
+class ReplayRecorder:
+    """Appends a run's inputs to a recording file as the simulation consumes them."""
+
+    def __init__(self, directory, seed, ticks_per_second=round(1 / SIMULATION_TICK)):
+        self.directory = directory
+        self.seed = seed
+        self.path = os.path.join(directory, f"run-{time.strftime('%Y%m%d-%H%M%S')}-{seed}.replay")
+        self.last_tick = 0
+        self.file = None
+        try:
+            os.makedirs(directory, exist_ok=True)
+            prune_replays(directory, MAX_REPLAYS - 1)
+            self.file = open(self.path, "wb")
+            self.file.write(HEADER.pack(MAGIC, FORMAT_VERSION, seed, ticks_per_second))
+            self.file.flush()
+        except Exception as e:
+            print(f"Error starting replay recording: {e}")
+            self.close()
+
+    def record(self, tick, inputs):
+        """Record the inputs consumed by the simulation step that became tick."""
+        if self.file is None:
+            return
+        try:
+            data = bytearray()
+            for action in inputs:
+                data += encode_varint(tick - self.last_tick)
+                data.append(INPUT_CODES[action])
+                self.last_tick = tick
+            self.file.write(data)
+            self.file.flush()  # Inputs survive a crash later in the run
+        except Exception as e:
+            print(f"Error recording replay: {e}")
+            self.close()
+
+    def finish(self, tick, score):
+        """Write the end record and close the file."""
+        if self.file is None:
+            return
+        try:
+            self.file.write(encode_varint(tick - self.last_tick) + bytes([END_CODE]) + SCORE.pack(score))
+        except Exception as e:
+            print(f"Error finishing replay: {e}")
+        self.close()
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+
+def prune_replays(directory, keep):
+    """Delete all but the newest keep recordings in a directory."""
+    names = sorted(name for name in os.listdir(directory) if name.endswith(".replay"))
+    for name in names[:max(len(names) - keep, 0)]:
+        os.remove(os.path.join(directory, name))
+
+
+class Replay:
+    """A loaded recording: the seed and the inputs to apply on each tick."""
+
+    def __init__(self, seed, ticks_per_second, inputs, end_tick=None, final_score=None):
+        self.seed = seed
+        self.ticks_per_second = ticks_per_second
+        self.inputs = inputs  # Tick -> list of inputs consumed by that step
+        self.end_tick = end_tick  # None if the run never finished (e.g. it crashed)
+        self.final_score = final_score
+
+    @property
+    def last_tick(self):
+        """The last tick worth simulating: the end record, or the last input of an unfinished run."""
+        if self.end_tick is not None:
+            return self.end_tick
+        return max(self.inputs, default=0)
+
+    def inputs_for(self, tick):
+        return self.inputs.get(tick, ())
+
+
+def load_replay(path):
+    """Read a recording; a torn last record (from a crash) is ignored."""
+    with open(path, "rb") as file:
+        data = file.read()
+    magic, version, seed, ticks_per_second = HEADER.unpack_from(data)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise ValueError(f"'{path}' is not a version {FORMAT_VERSION} replay")
+
+    inputs = {}
+    tick = 0
+    position = HEADER.size
+    while position < len(data):
+        try:
+            delta, position = decode_varint(data, position)
+            code = data[position]
+            position += 1
+        except IndexError:
+            break  # Torn record at the end of an interrupted recording
+        tick += delta
+        if code == END_CODE:
+            if position + SCORE.size > len(data):
+                break
+            (score,) = SCORE.unpack_from(data, position)
+            return Replay(seed, ticks_per_second, inputs, tick, score)
+        inputs.setdefault(tick, []).append(INPUT_NAMES[code])
+    return Replay(seed, ticks_per_second, inputs)
+
+
+def play_headless(replay, on_step=None):
+    """Re-simulate a recording without rendering, as fast as possible; returns the Simulation.
+
+    on_step(simulation, events) is called after every tick, e.g. to check invariants.
+    """
+    from core.simulation import Simulation
+
+    simulation = Simulation(seed=replay.seed)
+    dt = 1 / replay.ticks_per_second
+    while not simulation.game_over and simulation.tick < replay.last_tick:
+        events = simulation.step(dt, replay.inputs_for(simulation.tick + 1))
+        if on_step is not None:
+            on_step(simulation, events)
+    return simulation
+
+
+def play_in_window(replay):
+    """Re-simulate a recording in the game window at normal speed."""
+    import arcade
+    from core.game_window import GameWindow
+
+    window = arcade.Window(800, 600, "ComeHome replay")
+    view = GameWindow(seed=replay.seed, replay=replay)
+    view.setup()
+    window.show_view(view)
+    arcade.run()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("path", help="recording to play back")
+    parser.add_argument("--window", action="store_true", help="play in the game window at normal speed")
+    parser.add_argument("--profile", action="store_true", help="record per-phase timings and export them")
+    args = parser.parse_args(argv)
+
+    replay = load_replay(args.path)
+    if args.window:
+        play_in_window(replay)
+        return 0
+
+    from utils.profiler import profiler
+
+    on_step = None
+    if args.profile:
+        profiler.enable()
+        on_step = lambda simulation, events: profiler.end_frame()
+
+    start = time.perf_counter()
+    simulation = play_headless(replay, on_step)
+    elapsed = time.perf_counter() - start
+
+    speedup = simulation.tick / replay.ticks_per_second / elapsed if elapsed else float("inf")
+    print(f"Simulated {simulation.tick} ticks in {elapsed:.3f}s ({speedup:.0f}x real time), score {simulation.score:.3f}")
+    if replay.final_score is None:
+        print("The recording has no end record; the run did not finish (it may have crashed).")
+    elif simulation.tick != replay.end_tick or abs(simulation.score - replay.final_score) > 1e-6:
+        print(f"Mismatch: the recorded run ended at tick {replay.end_tick} with score {replay.final_score:.3f}")
+        return 1
+    else:
+        print("Matches the recorded run.")
+    if args.profile:
+        print(f"Frame profile written to {profiler.export()}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
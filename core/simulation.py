@@ -0,0 +1,410 @@
+import math
+import random
+from utils.constants import (
+    SCREEN_WIDTH, GROUND_HEIGHT, OBSTACLE_SPAWN_RATE, PLAYER_GRAVITY, PLAYER_JUMP_SPEED,
+    PLAYER_START_X, PLAYER_START_Y, BUG_SPAWN_MULTIPLIER,
+)
+from entities.lightning_bug_swarm import LightningBugSwarm
+from core.broad_phase import x_range, swept_x_range, reach
+from utils.hit_boxes import get_entity_shapes, box_bounds
+from utils.profiler import profiler
+
+# The original game moved everything by a fixed amount per frame at 60 FPS.
+# Per-frame speeds are scaled by dt / FRAME_TIME so a step of 1/60 matches it exactly.
+FRAME_TIME = 1 / 60
+
+# Seeds are kept to 64 bits, the width replays and snapshots store them in
+SEED_MASK = 2 ** 64 - 1
+
+# Inputs accepted by Simulation.step()
+INPUT_JUMP = "jump"
+
+# Events returned by Simulation.step()
+EVENT_SPAWN = "spawn"
+EVENT_DESPAWN = "despawn"
+EVENT_JUMP = "jump"
+EVENT_COIN_COLLECTED = "coin_collected"
+EVENT_GAME_OVER = "game_over"
+
+# Axis-aligned hit boxes (left, right, bottom, top) relative to the sprite center at scale 1,
+# measured from the alpha of the shipped sprite sheets (union over all animation frames).
+# Used when the cached shapes of utils.hit_boxes cannot be loaded.
+DEFAULT_HIT_BOXES = {
+    "player": (-19.0, 18.0, -20.5, 17.5),
+    "player_jump": (-19.0, 18.0, -20.5, 17.5),
+    "obstacle": (-10.0, 9.0, -10.0, 9.0),
+    "coin": (-16.0, 16.0, -16.0, 16.0),
+}
+
+# Full sprite widths at their drawn scale; an entity is despawned once it is this far past x = 0
+OBSTACLE_WIDTH = 32
+COIN_WIDTH = 32 * 0.5
+
+
+def segment_enters(window, x0, y0, x1, y1):
+    """Return whether the segment from (x0, y0) to (x1, y1) passes strictly inside a contact window.
+
+    Clips the segment's parameter range against the window's interval on each of its four axes
+    (Liang-Barsky); the segment enters the window if some part of the range survives.
+    """
+    x_min, x_max, y_min, y_max, sum_min, sum_max, diff_min, diff_max = window
+    t_enter = 0.0
+    t_exit = 1.0
+    for start, end, low, high in (
+        (x0, x1, x_min, x_max),
+        (y0, y1, y_min, y_max),
+        (x0 + y0, x1 + y1, sum_min, sum_max),
+        (x0 - y0, x1 - y1, diff_min, diff_max),
+    ):
+        delta = end - start
+        if delta == 0:
+            if not low < start < high:
+                return False
+            continue
+        t_low = (low - start) / delta
+        t_high = (high - start) / delta
+        if t_low > t_high:
+            t_low, t_high = t_high, t_low
+        t_enter = max(t_enter, t_low)
+        t_exit = min(t_exit, t_high)
+        if t_enter >= t_exit:
+            return False
+    return True
+
+
+class PlayerState:
+    """Player kinematics."""
+    def __init__(self):
+        self.x = PLAYER_START_X
+        self.y = PLAYER_START_Y
+        self.prev_y = self.y  # Position at the start of the last step, for render interpolation
+        self.change_y = 0
+        self.jumps_left = 2  # Allow double jumps
+
+
+class ObstacleState:
+    kind = "obstacle"
+    scale = 1.0
+
+    def __init__(self, entity_id, x, y):
+        self.id = entity_id
+        self.x = x
+        self.y = y
+        self.prev_x = x
+        self.prev_y = y
+        self.initial_speed = -5  # Obstacles start at -5 speed
+        self.change_x = self.initial_speed
+
+
+class CoinState:
+    kind = "coin"
+
+    def __init__(self, entity_id, x, y):
+        self.id = entity_id
+        self.x = x
+        self.y = y
+        self.prev_x = x
+        self.prev_y = y
+        self.initial_speed = -5  # Coins start at -5 speed
+        self.change_x = self.initial_speed
+        self.scale = 0.5
+        self.gravitating = False  # Whether the coin is gravitating towards the player
+
+
+class Simulation:
+    """Headless game rules: speed ramp, scoring, spawning, player physics, coin magnetism and collisions.
+
+    Owns the whole world state and never touches arcade, the GPU or audio. Views feed it inputs through
+    step() and react to the events it returns.
+    """
+
+    def __init__(self, seed=None, hit_boxes=None, ambient=True):
+        self.seed = seed & SEED_MASK if seed is not None else random.randrange(2 ** 32)
+        self.rng = random.Random(self.seed)  # Gameplay randomness (coin heights)
+        # Collision shapes in the utils.hit_boxes bounds layout; hit_boxes overrides them with plain
+        # boxes, a "player" box standing in for both player poses unless "player_jump" is given
+        hit_boxes = dict(hit_boxes or {})
+        if "player" in hit_boxes:
+            hit_boxes.setdefault("player_jump", hit_boxes["player"])
+        self.shapes = {kind: box_bounds(box) for kind, box in DEFAULT_HIT_BOXES.items()}
+        self.shapes.update(get_entity_shapes())
+        self.shapes.update({kind: box_bounds(box) for kind, box in hit_boxes.items()})
+        self.hit_boxes = {kind: shape[:4] for kind, shape in self.shapes.items()}  # x/y extents, for the broad phase
+        self.ambient = ambient  # Simulate the decorative lightning bugs
+
+        # Speed and distance
+        self.score = 0
+        self.running_speed = 200  # Player's initial running speed in pixels per second
+        self.pixels_to_meters = 0.1  # Conversion factor: 10 pixels = 1 meter
+        self.speed_increase_rate = 1  # Pixels per second increase every second
+        self.max_running_speed = 5000  # Maximum running speed
+
+        # Coin magnet
+        self.magnet_radius = 100
+        self.magnet_pull_x = 7
+        self.magnet_pull_y = 2
+
+        # World state
+        self.player = PlayerState()
+        self.obstacles = []  # Sorted by x (spawn order)
+        self.coins = []  # Free-scrolling coins, sorted by x (spawn order)
+        self.magnet_coins = []  # Coins gravitating towards the player, outside the sorted list
+        self.bugs = LightningBugSwarm(self.seed ^ 0x5EED, spawn_multiplier=BUG_SPAWN_MULTIPLIER)
+        self.next_entity_id = 0
+        self.tick = 0
+        self.time_since_last_obstacle = 0
+        self.time_since_last_coin = 0
+        self.time_since_last_bug = 0
+        self.coins_collected = 0
+        self.game_over = False
+        self.invulnerable = False  # Obstacle hits do not end the run (benchmarks and bots)
+        self.swept_collisions = True  # Hit-test the path moved over each step, not only where it ended
+
+        self.events = []
+
+    ################################################################################################
+    # Stepping
+    ################################################################################################
+    def step(self, dt, inputs=()):
+        """Advance the world by dt seconds and return the events that happened."""
+        self.events = []
+        if self.game_over:
+            return self.events
+
+        frames = dt / FRAME_TIME
+        self.tick += 1
+
+        for action in inputs:
+            if action == INPUT_JUMP:
+                self.jump()
+
+        # Gradually increase the running speed
+        self.running_speed = min(self.running_speed + self.speed_increase_rate * dt, self.max_running_speed)
+
+        # Update the distance score
+        self.score += self.running_speed * dt * self.pixels_to_meters
+
+        with profiler.scope("update_player"):
+            self.update_player(frames)
+        with profiler.scope("update_obstacles"):
+            self.update_obstacles(frames)
+        with profiler.scope("update_coins"):
+            self.update_coins(frames)
+
+        if self.ambient:
+            with profiler.scope("update_bugs"):
+                self.update_bugs(frames, dt)
+
+                # Spawn lightning bugs periodically
+                self.time_since_last_bug += dt
+                if self.time_since_last_bug > 1:
+                    self.time_since_last_bug = 0
+                    self.bugs.spawn()
+
+        with profiler.scope("remove_expired"):
+            self.remove_expired(self.obstacles, OBSTACLE_WIDTH)
+            self.remove_expired(self.coins, COIN_WIDTH)
+        with profiler.scope("spawn"):
+            self.spawn_periodic_objects(dt)
+        with profiler.scope("collisions"):
+            self.handle_collisions()
+        return self.events
+
+    def jump(self):
+        """Make the player jump if jumps are available."""
+        player = self.player
+        if player.jumps_left > 0:
+            player.change_y = PLAYER_JUMP_SPEED
+            player.jumps_left -= 1
+            self.events.append((EVENT_JUMP, None))
+
+    def update_player(self, frames):
+        """Apply gravity and keep the player above the ground."""
+        player = self.player
+        player.prev_y = player.y
+        player.change_y -= PLAYER_GRAVITY * frames
+        player.y += player.change_y * frames
+
+        if player.y < GROUND_HEIGHT:
+            player.y = GROUND_HEIGHT
+            player.change_y = 0
+            player.jumps_left = 2  # Reset jumps when the player lands
+
+    def update_obstacles(self, frames):
+        """Move obstacles based on the current running speed."""
+        change_x = -(self.running_speed / 100)
+        for obstacle in self.obstacles:
+            obstacle.prev_x = obstacle.x
+            obstacle.change_x = obstacle.initial_speed + change_x
+            obstacle.x += obstacle.change_x * frames
+
+    def update_coins(self, frames):
+        """Move coins and pull them towards the player once they are close enough.
+
+        Every coin is visited once: scrolling coins are moved in one pass, coins already
+        gravitating are pulled in a second, and the few coins that start gravitating this tick
+        are pulled as soon as the magnet test catches them.
+        """
+        player = self.player
+        change_x = -(self.running_speed / 100)
+        for coin in self.coins:
+            coin.prev_x = coin.x
+            coin.prev_y = coin.y
+            coin.change_x = coin.initial_speed + change_x
+            coin.x += coin.change_x * frames
+        for coin in self.magnet_coins:
+            coin.prev_x = coin.x
+            coin.prev_y = coin.y
+            self.pull_coin(coin, frames)
+
+        # Only coins within the magnet radius along x can start gravitating
+        start, end = x_range(self.coins, player.x - self.magnet_radius, player.x + self.magnet_radius)
+        if start < end:
+            nearby = self.coins[start:end]
+            for coin in nearby:
+                distance_to_player = math.sqrt((coin.x - player.x) ** 2 + (coin.y - player.y) ** 2)
+                if distance_to_player < self.magnet_radius:
+                    coin.gravitating = True
+                    self.magnet_coins.append(coin)
+                    self.pull_coin(coin, frames)
+            self.coins[start:end] = [coin for coin in nearby if not coin.gravitating]
+
+    def pull_coin(self, coin, frames):
+        """Move a gravitating coin towards the player and shrink it."""
+        player = self.player
+        angle = math.atan2(player.y - coin.y, player.x - coin.x)
+        coin.x += math.cos(angle) * self.magnet_pull_x * frames
+        coin.y += math.sin(angle) * self.magnet_pull_y * frames
+        coin.scale = max(0.5, coin.scale - 0.05 * frames)
+
+    def update_bugs(self, frames, dt):
+        """Move, animate and expire the whole lightning bug swarm in one vectorized step."""
+        self.bugs.update(frames, dt)
+
+    ################################################################################################
+    # Spawning and Despawning
+    ################################################################################################
+    def _next_id(self):
+        self.next_entity_id += 1
+        return self.next_entity_id
+
+    def spawn_obstacle(self):
+        obstacle = ObstacleState(self._next_id(), SCREEN_WIDTH, GROUND_HEIGHT + 20)
+        self.obstacles.append(obstacle)
+        self.events.append((EVENT_SPAWN, obstacle))
+
+    def spawn_coin(self):
+        y = GROUND_HEIGHT + self.rng.randint(20, 100)  # Spawn near the ground with slight variation
+        coin = CoinState(self._next_id(), SCREEN_WIDTH, y)
+        self.coins.append(coin)
+        self.events.append((EVENT_SPAWN, coin))
+
+    def spawn_periodic_objects(self, dt):
+        """Spawn obstacles and coins periodically based on running speed."""
+        adjusted_obstacle_spawn_rate = OBSTACLE_SPAWN_RATE / (self.running_speed / 200)
+        adjusted_coin_spawn_rate = 1.0 / (self.running_speed / 200)
+
+        self.time_since_last_obstacle += dt
+        if self.time_since_last_obstacle > adjusted_obstacle_spawn_rate:
+            self.time_since_last_obstacle = 0
+            self.spawn_obstacle()
+
+        self.time_since_last_coin += dt
+        if self.time_since_last_coin > adjusted_coin_spawn_rate:
+            self.time_since_last_coin = 0
+            self.spawn_coin()
+
+    def remove_expired(self, entities, width):
+        """Pop entities that have scrolled off the left edge of the screen.
+
+        Everything scrolls left at the same speed and the list is sorted by x, so the expired
+        entities are always a prefix: only that prefix (plus one live entity) is looked at.
+        """
+        expired = 0
+        for entity in entities:
+            if entity.x >= -width:
+                break
+            self.events.append((EVENT_DESPAWN, entity))
+            expired += 1
+        if expired:
+            del entities[:expired]
+
+    ################################################################################################
+    # Collisions
+    ################################################################################################
+    def player_shape(self):
+        """Return the kind of the player's current shape: jumping in the air, running on the ground."""
+        return "player_jump" if self.player.y > GROUND_HEIGHT else "player"
+
+    def contact_window(self, kind, scale=1.0):
+        """Return where an entity's center must be, relative to the player's, to overlap the player's current shape.
+
+        Shapes are bounded on the x, y, x + y and x - y axes, and boxes and hulls have no edges
+        normal to any other axis, so by the separating axis theorem they overlap exactly when
+        the center is strictly inside all four intervals, returned as (x_min, x_max, y_min,
+        y_max, sum_min, sum_max, diff_min, diff_max).
+        """
+        px_left, px_right, py_bottom, py_top, ps_min, ps_max, pd_min, pd_max = self.shapes[self.player_shape()]
+        left, right, bottom, top, sum_min, sum_max, diff_min, diff_max = self.shapes[kind]
+        return (px_left - right * scale, px_right - left * scale,
+                py_bottom - top * scale, py_top - bottom * scale,
+                ps_min - sum_max * scale, ps_max - sum_min * scale,
+                pd_min - diff_max * scale, pd_max - diff_min * scale)
+
+    def touching(self, kind, entities):
+        """Return the entities whose shape overlapped the player's at some point of the last step.
+
+        Relative to the player, an entity's center moves in a straight line over a step. With
+        swept collisions an entity touches if that segment passes through the contact window,
+        so a fast obstacle cannot jump over the player between two steps; otherwise only where
+        it ended the step counts.
+        """
+        player = self.player
+        swept = self.swept_collisions
+        windows = {}  # Scale -> contact window; nearly every entity of a kind shares one scale
+        touching = []
+        for entity in entities:
+            window = windows.get(entity.scale)
+            if window is None:
+                window = windows[entity.scale] = self.contact_window(kind, entity.scale)
+            x_min, x_max, y_min, y_max, sum_min, sum_max, diff_min, diff_max = window
+            x = entity.x - player.x
+            y = entity.y - player.y
+            if x_min < x < x_max and y_min < y < y_max and sum_min < x + y < sum_max and diff_min < x - y < diff_max:
+                touching.append(entity)
+            elif swept and segment_enters(window, entity.prev_x - player.x, entity.prev_y - player.prev_y, x, y):
+                touching.append(entity)
+        return touching
+
+    def handle_collisions(self):
+        """End the run on an obstacle hit and collect touched coins.
+
+        Only entities whose x-interval can reach the player (or, with swept collisions, crossed
+        that interval during the step) are hit-tested.
+        """
+        find = swept_x_range if self.swept_collisions else x_range
+        player_box = self.hit_boxes[self.player_shape()]
+        x_min, x_max = reach(self.player.x, player_box, self.hit_boxes["obstacle"])
+        start, end = find(self.obstacles, x_min, x_max)
+        hit = self.touching("obstacle", self.obstacles[start:end])
+        if hit and not self.invulnerable:
+            self.game_over = True
+            self.events.append((EVENT_GAME_OVER, hit[0]))
+
+        # Coin scale never grows above 1, so the unscaled box bounds the search
+        x_min, x_max = reach(self.player.x, player_box, self.hit_boxes["coin"])
+        start, end = find(self.coins, x_min, x_max)
+        nearby = self.coins[start:end]
+        collected = self.touching("coin", nearby)
+        if collected:
+            removed = set(collected)
+            self.coins[start:end] = [coin for coin in nearby if coin not in removed]
+        pulled = self.touching("coin", self.magnet_coins)
+        if pulled:
+            removed = set(pulled)
+            self.magnet_coins = [coin for coin in self.magnet_coins if coin not in removed]
+            collected += pulled
+
+        for coin in collected:
+            self.coins_collected += 1
+            self.events.append((EVENT_COIN_COLLECTED, coin))
@@ -0,0 +1,201 @@
+"""World snapshots: the complete gameplay state of a Simulation in one compact binary blob.
+
+A snapshot holds everything the simulation needs to carry on exactly where it was: counters,
+speed and score, the player's kinematics, every obstacle and coin, the lightning bug arrays,
+both random generators, plus named timers of the view running it. Restoring one rewinds an
+existing Simulation in place, so nothing else has to be rebuilt.
+
+Layout (little endian): MAGIC, format version (u8), then zlib-compressed sections in the order
+WORLD, PLAYER, obstacles, coins, magnet coins, gameplay RNG, bug swarm, timers.
+"""
+import os
+import struct
+import threading
+import zlib
+import numpy as np
+from core.simulation import ObstacleState, CoinState
+from entities.lightning_bug_swarm import FIELDS
+
+MAGIC = b"CHSN"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sB")
+
+# Counters, speed, score and spawn timers; flags are game_over, invulnerable, swept collisions and ambient
+WORLD = struct.Struct("<QIIdddddddIB")
+PLAYER = struct.Struct("<ddddb")
+OBSTACLE = struct.Struct("<Iddddd")  # id, x, y, prev_x, prev_y, change_x
+COIN = struct.Struct("<Iddddddb")  # id, x, y, prev_x, prev_y, change_x, scale, gravitating
+COUNT = struct.Struct("<I")
+
+# random.Random state: the Mersenne Twister words and position, and the cached gauss value
+RANDOM_STATE = struct.Struct("<625I?d")
+
+# Lightning bug swarm: live bug count, elapsed frames, spawn multiplier and the PCG64 state
+SWARM = struct.Struct("<IdI16s16sBI")
+SWARM_ARRAYS = FIELDS + ("frame", "expires_at")
+
+TIMER = struct.Struct("<Bd")  # Name length, seconds left; the name follows
+
+# Where a suspended run is kept, next to the player's profile
+SUSPEND_FILE = "suspended.snapshot"
+
+FLAG_NAMES = ("game_over", "invulnerable", "swept_collisions", "ambient")
+
+
+def pack_random(rng):
+    version, words, gauss = rng.getstate()
+    return RANDOM_STATE.pack(*words, gauss is not None, gauss or 0.0)
+
+
+def unpack_random(rng, data, position):
+    values = RANDOM_STATE.unpack_from(data, position)
+    rng.setstate((3, values[:625], values[626] if values[625] else None))
+    return position + RANDOM_STATE.size
+
+
+def pack_swarm(swarm):
+    state = swarm.rng.bit_generator.state
+    parts = [SWARM.pack(
+        len(swarm), swarm.elapsed, swarm.spawn_multiplier,
+        state["state"]["state"].to_bytes(16, "little"), state["state"]["inc"].to_bytes(16, "little"),
+        state["has_uint32"], state["uinteger"],
+    )]
+    for name in SWARM_ARRAYS:
+        parts.append(swarm.live(name).tobytes())
+    return b"".join(parts)
+
+
+def unpack_swarm(swarm, data, position):
+    count, elapsed, spawn_multiplier, rng_state, rng_inc, has_uint32, uinteger = SWARM.unpack_from(data, position)
+    position += SWARM.size
+    capacity = swarm.capacity
+    while capacity < count:
+        capacity *= 2
+    for name in SWARM_ARRAYS:
+        dtype = np.int64 if name == "frame" else np.float64
+        values = np.frombuffer(data, dtype=dtype, count=count, offset=position)
+        position += values.nbytes
+        array = np.zeros(capacity, dtype=dtype)
+        array[:count] = values
+        setattr(swarm, name, array)
+    swarm.capacity = capacity
+    swarm.head = 0
+    swarm.count = count
+    swarm.elapsed = elapsed
+    swarm.spawn_multiplier = spawn_multiplier
+    swarm.rng.bit_generator.state = {
+        "bit_generator": "PCG64",
+        "state": {"state": int.from_bytes(rng_state, "little"), "inc": int.from_bytes(rng_inc, "little")},
+        "has_uint32": has_uint32,
+        "uinteger": uinteger,
+    }
+    return position
+
+
+def take_snapshot(simulation, timers=None):
+    """Return the simulation's state, plus {name: seconds left} timers, as a compressed blob."""
+    flags = sum(1 << i for i, name in enumerate(FLAG_NAMES) if getattr(simulation, name))
+    player = simulation.player
+    parts = [
+        WORLD.pack(
+            simulation.seed, simulation.tick, simulation.next_entity_id,
+            simulation.score, simulation.running_speed, simulation.speed_increase_rate,
+            simulation.max_running_speed, simulation.time_since_last_obstacle,
+            simulation.time_since_last_coin, simulation.time_since_last_bug,
+            simulation.coins_collected, flags,
+        ),
+        PLAYER.pack(player.x, player.y, player.prev_y, player.change_y, player.jumps_left),
+        COUNT.pack(len(simulation.obstacles)),
+    ]
+    for o in simulation.obstacles:
+        parts.append(OBSTACLE.pack(o.id, o.x, o.y, o.prev_x, o.prev_y, o.change_x))
+    for coins in (simulation.coins, simulation.magnet_coins):
+        parts.append(COUNT.pack(len(coins)))
+        for c in coins:
+            parts.append(COIN.pack(c.id, c.x, c.y, c.prev_x, c.prev_y, c.change_x, c.scale, c.gravitating))
+    parts.append(pack_random(simulation.rng))
+    parts.append(pack_swarm(simulation.bugs))
+
+    timers = timers or {}
+    parts.append(COUNT.pack(len(timers)))
+    for name, seconds in timers.items():
+        encoded = name.encode("utf-8")
+        parts.append(TIMER.pack(len(encoded), seconds) + encoded)
+    return HEADER.pack(MAGIC, FORMAT_VERSION) + zlib.compress(b"".join(parts))
+
+
+def restore_snapshot(simulation, snapshot):
+    """Rewind a simulation to a snapshot in place; returns the snapshot's {name: seconds left} timers."""
+    magic, version = HEADER.unpack_from(snapshot)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise ValueError(f"Not a version {FORMAT_VERSION} world snapshot")
+    data = zlib.decompress(snapshot[HEADER.size:])
+
+    (simulation.seed, simulation.tick, simulation.next_entity_id,
+     simulation.score, simulation.running_speed, simulation.speed_increase_rate,
+     simulation.max_running_speed, simulation.time_since_last_obstacle,
+     simulation.time_since_last_coin, simulation.time_since_last_bug,
+     simulation.coins_collected, flags) = WORLD.unpack_from(data)
+    for i, name in enumerate(FLAG_NAMES):
+        setattr(simulation, name, bool(flags >> i & 1))
+    position = WORLD.size
+
+    player = simulation.player
+    player.x, player.y, player.prev_y, player.change_y, player.jumps_left = PLAYER.unpack_from(data, position)
+    position += PLAYER.size
+
+    (count,) = COUNT.unpack_from(data, position)
+    position += COUNT.size
+    simulation.obstacles = []
+    for entity_id, x, y, prev_x, prev_y, change_x in OBSTACLE.iter_unpack(data[position:position + count * OBSTACLE.size]):
+        obstacle = ObstacleState(entity_id, x, y)
+        obstacle.prev_x, obstacle.prev_y, obstacle.change_x = prev_x, prev_y, change_x
+        simulation.obstacles.append(obstacle)
+    position += count * OBSTACLE.size
+
+    coin_lists = []
+    for _ in range(2):
+        (count,) = COUNT.unpack_from(data, position)
+        position += COUNT.size
+        coins = []
+        for entity_id, x, y, prev_x, prev_y, change_x, scale, gravitating in COIN.iter_unpack(
+                data[position:position + count * COIN.size]):
+            coin = CoinState(entity_id, x, y)
+            coin.prev_x, coin.prev_y, coin.change_x = prev_x, prev_y, change_x
+            coin.scale, coin.gravitating = scale, bool(gravitating)
+            coins.append(coin)
+        position += count * COIN.size
+        coin_lists.append(coins)
+    simulation.coins, simulation.magnet_coins = coin_lists
+
+    position = unpack_random(simulation.rng, data, position)
+    position = unpack_swarm(simulation.bugs, data, position)
+    simulation.events = []
+
+    timers = {}
+    (count,) = COUNT.unpack_from(data, position)
+    position += COUNT.size
+    for _ in range(count):
+        length, seconds = TIMER.unpack_from(data, position)
+        position += TIMER.size
+        timers[data[position:position + length].decode("utf-8")] = seconds
+        position += length
+    return timers
+
+
+def write_snapshot(path, snapshot):
+    """Write a snapshot file atomically (temp file + os.replace)."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}-{threading.get_ident()}.tmp"
+    with open(temp_path, "wb") as file:
+        file.write(snapshot)
+    os.replace(temp_path, path)
+
+
+def read_snapshot(path):
+    """Return a snapshot file's contents, or None if there is none."""
+    try:
+        with open(path, "rb") as file:
+            return file.read()
+    except FileNotFoundError:
+        return None
@@ -18,13 +18,9 @@ class GroundTile(AnimatedSprite):
         self.center_x = x
         self.center_y = y
 
-        # Randomize the starting frame to offset animations
-        self.current_frame = random.randint(0, frame_count - 1)
-        self.time_since_last_frame = random.uniform(0, frame_duration)
-
 
 class Ground:
-    def __init__(self):
+    def __init__(self, animations):
         self.tiles = arcade.SpriteList()
 
         # Path to the ground tile sprite sheet
@@ -51,12 +47,14 @@ class Ground:
             )
             self.tiles.append(tile)
 
+            # Every tile shares one animation clock, offset by a random starting frame
+            animations.add(tile, phase=random.randint(0, frame_count - 1))
+
     def update(self, delta_time, speed):
         """Update the ground tiles to scroll."""
-        # Move tiles to the left
+        # Move tiles to the left; their animation runs on the view's shared clock
         for tile in self.tiles:
             tile.center_x -= speed * delta_time
-            tile.update_animation(delta_time)  # Update animation frame
 
         # Recycle tiles when they go off-screen
         for tile in self.tiles:
@@ -0,0 +1,132 @@
+import math
+import numpy as np
+from utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT, BUG_MIN_COUNT, BUG_MAX_COUNT, BUG_SCALE
+
+# Bugs are removed once they are a full sprite width past the left edge
+BUG_WIDTH = 32 * BUG_SCALE
+BUG_FRAME_COUNT = 6
+BUG_FRAME_DURATION = 0.1  # Seconds per animation frame
+
+# Per-bug state, each kept in its own NumPy array
+FIELDS = (
+    "x", "y", "prev_x", "prev_y", "base_y",
+    "sway_angle", "sway_speed", "sway_amplitude", "float_speed",
+    "frame_time",
+)
+
+
+class LightningBugSwarm:
+    """Ambient lightning bugs simulated as a structure of NumPy arrays.
+
+    Live bugs occupy the index range ``head:count``; the whole swarm moves, sways and animates
+    in a handful of vectorized operations per step instead of one Python object per bug.
+
+    Bugs drift left at a constant speed, so the moment each one leaves the screen is known when it
+    spawns. The arrays are kept ordered by that moment, which makes expiry a pop from the head:
+    the head offset advances past the expired bugs and nothing else is touched.
+    """
+
+    def __init__(self, seed, capacity=128, spawn_multiplier=1):
+        self.rng = np.random.default_rng(seed)
+        self.spawn_multiplier = spawn_multiplier  # Raise for denser swarms on higher-quality settings
+        self.head = 0  # Index of the first live bug
+        self.count = 0  # One past the index of the last live bug
+        self.capacity = capacity
+        self.elapsed = 0.0  # Frames simulated so far, the clock expiry times are measured on
+        for name in FIELDS:
+            setattr(self, name, np.zeros(capacity, dtype=np.float64))
+        self.frame = np.zeros(capacity, dtype=np.int64)
+        self.expires_at = np.zeros(capacity, dtype=np.float64)  # Elapsed frames at which each bug is off screen
+
+    def __len__(self):
+        return self.count - self.head
+
+    def live(self, name):
+        """Return a view of one per-bug array covering only the live bugs."""
+        return getattr(self, name)[self.head:self.count]
+
+    def spawn(self, count=None, x=None):
+        """Spawn a cluster of bugs just past the right edge of the screen.
+
+        ``x`` optionally overrides the spawn positions (benchmarks fill the whole screen).
+        """
+        if count is None:
+            count = int(self.rng.integers(BUG_MIN_COUNT, BUG_MAX_COUNT + 1)) * self.spawn_multiplier
+
+        rng = self.rng
+        new = {}
+        new["x"] = SCREEN_WIDTH + rng.integers(0, 201, count).astype(np.float64)
+        new["y"] = rng.integers(SCREEN_HEIGHT // 2, SCREEN_HEIGHT - 50 + 1, count).astype(np.float64)
+        if x is not None:
+            new["x"] = np.asarray(x, dtype=np.float64)
+        new["prev_x"] = new["x"]
+        new["prev_y"] = new["y"]
+        new["base_y"] = new["y"]
+        new["sway_angle"] = rng.uniform(0, math.pi * 2, count)
+        new["sway_speed"] = rng.uniform(0.05, 0.1, count)
+        new["sway_amplitude"] = rng.uniform(5, 6, count)
+        new["float_speed"] = rng.uniform(-4, -2.5, count)
+        new["frame_time"] = np.zeros(count)
+        new["frame"] = np.zeros(count, dtype=np.int64)
+        # A bug is gone once x + float_speed * frames < -BUG_WIDTH
+        new["expires_at"] = self.elapsed + (new["x"] + BUG_WIDTH) / -new["float_speed"]
+
+        # Merge the new bugs into the live ones, ordered by expiry, packed at the start of the arrays
+        live = len(self)
+        total = live + count
+        capacity = self.capacity
+        while capacity < total:
+            capacity *= 2
+        order = np.argsort(np.concatenate((self.live("expires_at"), new["expires_at"])), kind="stable")
+        for name in FIELDS + ("frame", "expires_at"):
+            merged = np.concatenate((self.live(name), new[name]))[order]
+            if capacity != self.capacity:
+                setattr(self, name, np.zeros(capacity, dtype=merged.dtype))
+            getattr(self, name)[:total] = merged
+        self.capacity = capacity
+        self.head = 0
+        self.count = total
+
+    def update(self, frames, dt):
+        """Move, sway and animate every bug, then drop the ones that left the screen."""
+        if self.count == self.head:
+            return
+
+        x = self.live("x")
+        y = self.live("y")
+        self.live("prev_x")[:] = x
+        self.live("prev_y")[:] = y
+
+        # Gentle drift and sway
+        x += self.live("float_speed") * frames
+        sway_angle = self.live("sway_angle")
+        sway_angle += self.live("sway_speed") * frames
+        np.sin(sway_angle, out=y)
+        y *= self.live("sway_amplitude")
+        y += self.live("base_y")
+
+        # Animation: advance the frame of every bug whose frame time ran out
+        frame_time = self.live("frame_time")
+        frame_time += dt
+        advance = frame_time > BUG_FRAME_DURATION
+        frame_time[advance] = 0
+        frame = self.live("frame")
+        frame[advance] = (frame[advance] + 1) % BUG_FRAME_COUNT
+
+        self.elapsed += frames
+        self.remove_expired()
+
+    def remove_expired(self):
+        """Pop the bugs whose expiry time has passed off the head of the arrays."""
+        expired = int(np.searchsorted(self.live("expires_at"), self.elapsed, side="left"))
+        self.head += expired
+
+    def positions(self, alpha=1.0):
+        """Return the x and y arrays interpolated between the last two steps."""
+        prev_x = self.live("prev_x")
+        prev_y = self.live("prev_y")
+        return prev_x + (self.live("x") - prev_x) * alpha, prev_y + (self.live("y") - prev_y) * alpha
+
+    def facing_right(self):
+        """Return a mask of bugs drifting to the right, which are drawn mirrored."""
+        return self.live("float_speed") > 0
@@ -1,5 +1,7 @@
 import arcade
-from utils.constants import PLAYER_START_X, PLAYER_START_Y, PLAYER_JUMP_SPEED, GROUND_HEIGHT, PLAYER_GRAVITY
+from utils.frame_cache import load_frame_strip
+from utils.sound_bank import sound_bank
+from utils.constants import PLAYER_START_X, PLAYER_START_Y, GROUND_HEIGHT
 
 class Player(arcade.Sprite):
     def __init__(self):
@@ -38,29 +40,30 @@ class Player(arcade.Sprite):
         self.change_y = 0
         self.change_x = 0
 
-        # Jumping state
-        self.jumps_left = 2  # Allow double jumps
-        self.jump_speed = PLAYER_JUMP_SPEED
-
-        # Load the running sound
-        self.running_sound = arcade.Sound("assets/sounds/characters/running.wav")
+        # Running sound state
         self.running_sound_playing = False  # Track if the sound is already playing
 
+    def reset(self):
+        """Restore the starting frame and position for a new run."""
+        self.current_frame = 0
+        self.time_since_last_frame = 0
+        self.texture = self.running_textures[0]
+        self.position = (PLAYER_START_X, PLAYER_START_Y)
+        self.change_y = 0
+        self.change_x = 0
+        self.running_sound_playing = False
+
     def load_running_textures(self, sprite_sheet_path):
         """Load textures for the running animation."""
-        for i in range(self.running_frame_count):
-            x = i * self.running_frame_width
-            try:
-                frame = arcade.load_texture(
-                    sprite_sheet_path,
-                    x=x,
-                    y=0,
-                    width=self.running_frame_width,
-                    height=self.running_frame_height,
-                )
-                self.running_textures.append(frame)
-            except Exception as e:
-                print(f"Error loading running frame {i}: {e}")
+        try:
+            self.running_textures = list(load_frame_strip(
+                sprite_sheet_path,
+                self.running_frame_width,
+                self.running_frame_height,
+                self.running_frame_count,
+            ))
+        except Exception as e:
+            print(f"Error loading running frames: {e}")
 
         if not self.running_textures:
             print(f"ERROR: No running frames loaded. Check path: {sprite_sheet_path}.")
@@ -68,44 +71,20 @@ class Player(arcade.Sprite):
 
     def load_jumping_textures(self, sprite_sheet_path):
         """Load textures for the jumping animation."""
-        for i in range(self.jumping_frame_count):
-            x = i * self.jumping_frame_width
-            try:
-                frame = arcade.load_texture(
-                    sprite_sheet_path,
-                    x=x,
-                    y=0,
-                    width=self.jumping_frame_width,
-                    height=self.jumping_frame_height,
-                )
-                self.jumping_textures.append(frame)
-            except Exception as e:
-                print(f"Error loading jumping frame {i}: {e}")
+        try:
+            self.jumping_textures = list(load_frame_strip(
+                sprite_sheet_path,
+                self.jumping_frame_width,
+                self.jumping_frame_height,
+                self.jumping_frame_count,
+            ))
+        except Exception as e:
+            print(f"Error loading jumping frames: {e}")
 
         if not self.jumping_textures:
             print(f"ERROR: No jumping frames loaded. Check path: {sprite_sheet_path}.")
             raise FileNotFoundError("Jumping sprite sheet could not be loaded.")
 
-    def update(self):
-        """Update the player's position with gravity."""
-        # Apply gravity
-        self.change_y -= PLAYER_GRAVITY
-        self.center_y += self.change_y
-
-        # Prevent the player from falling below the ground
-        if self.center_y < GROUND_HEIGHT:
-            self.center_y = GROUND_HEIGHT
-            self.change_y = 0
-            self.jumps_left = 2  # Reset jumps when the player lands
-
-    def jump(self):
-        """Make the player jump if jumps are available."""
-        if self.jumps_left > 0:
-            self.jump_audio = arcade.Sound('assets/sounds/game_sounds/jump.wav')
-            self.jump_audio.play()
-            self.change_y = self.jump_speed
-            self.jumps_left -= 1  # Use a jump
-
     def update_animation(self, delta_time):
         """Update the animation based on elapsed time."""
         self.time_since_last_frame += delta_time
@@ -127,7 +106,7 @@ class Player(arcade.Sprite):
         # Play or stop the running sound based on movement
         if self.center_y == GROUND_HEIGHT and self.change_x != 0:  # Player is running on the ground
             if not self.running_sound_playing:
-                self.running_sound.play(loop=True)
+                sound_bank.play("running", loop=True)
                 self.running_sound_playing = True
         else:  # Stop the sound if jumping or idle
             if self.running_sound_playing:
@@ -1,6 +1,9 @@
 import arcade
-from core.loading_screen import LoadingScreen
+from utils.view_registry import views
 from utils.util import BackgroundMusicManager
+from utils.timers import timers
+from utils.profiler import profiler
+from utils.profiler_overlay import ProfilerPanel
 
 class ComeHomeGame(arcade.Window):
     def __init__(self):
@@ -18,26 +21,50 @@ class ComeHomeGame(arcade.Window):
             self.custom_cursor = None
 
         # Show the initial loading screen
-        self.loading_screen = LoadingScreen()
-        self.show_view(self.loading_screen)
+        self.loading_screen = views.show("loading")
 
         # Initialize the background music manager
-        self.music_manager = BackgroundMusicManager("assets/sounds/background/GuitarStrum.wav")
+        self.music_manager = BackgroundMusicManager("guitar_strum")
         self.music_manager.play_music()
 
+        # Frame profiler panel, toggled with F3
+        self.profiler_panel = ProfilerPanel()
+
     def on_draw(self):
         # Ensure the current view's draw method is called
         super().on_draw()
 
-        # Draw the custom cursor
-        if self.custom_cursor:
+        # Draw the custom cursor, unless the view's overlay already batches it with the HUD
+        if self.custom_cursor and getattr(self.current_view, "overlay", None) is None:
             # Offset the cursor's position so that the (0,0) point of the image aligns with the mouse
             self.custom_cursor.center_x = self._mouse_x + self.cursor_width / 2
             self.custom_cursor.center_y = self._mouse_y - self.cursor_height / 2
             self.custom_cursor.draw()
 
+        if profiler.visible:
+            self.profiler_panel.draw()
+        profiler.end_frame()
+
+    def on_key_press(self, key, modifiers):
+        """Debug keys available in every view: F3 toggles the profiler, F4 exports its frames."""
+        if key == arcade.key.F3:
+            profiler.toggle()
+        elif key == arcade.key.F4 and profiler.enabled:
+            try:
+                print(f"Frame profile written to {profiler.export()}")
+            except Exception as e:
+                print(f"Error exporting frame profile: {e}")
+
+    def on_close(self):
+        """Suspend a run in progress so the next launch can resume it."""
+        game = views.views.get("game")
+        if game is not None:
+            game.suspend()
+        super().on_close()
+
     def on_update(self, delta_time):
         """Global updates, including background music volume adjustment."""
+        timers.advance(delta_time)  # Game clock for every view's timers
         self.music_manager.update_volume(delta_time)
 
 def main():
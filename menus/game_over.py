@@ -1,20 +1,21 @@
 import arcade
-import os
 from utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT, GAME_RED
-from utils.util import draw_parallax_background
+from utils.parallax import ParallaxBackground
+from utils.frame_cache import load_frame_strip, load_scaled_image
+from utils.overlay import Overlay
+from utils.profile_store import profile_store
+from utils.view_registry import views
 
 class GameOver(arcade.View):
-    def __init__(self, final_score):
+    def __init__(self, final_score=0):
         super().__init__()
         self.final_score = final_score
 
         # Background layers
-        self.background_layers = []
-        self.background_speeds = [0.05, 0.125, 0.25, 0.5]  # Parallax speeds
-        self.background_offsets = [0, 0, 0, 0]  # Track each layer's horizontal offset
+        self.background = ParallaxBackground([0.05, 0.125, 0.25, 0.5], SCREEN_WIDTH, SCREEN_HEIGHT)
 
         # Load the GameOver image
-        self.game_over_image = arcade.load_texture("assets/images/game/menus/GameOver.png")
+        self.game_over_image = load_scaled_image("assets/images/game/menus/GameOver.png", SCREEN_WIDTH, SCREEN_HEIGHT)
         
         self.total_coins_collected = 0
         
@@ -27,6 +28,10 @@ class GameOver(arcade.View):
         # Load the coin animation frames
         self.load_coin_animation()
 
+        # Retained text and HUD sprites
+        self.overlay = Overlay()
+        self.build_overlay()
+
     def load_coin_animation(self):
         """Load the coin animation frames."""
         sprite_sheet_path = "assets/images/world_assets/coin.png"  # Path to the coin sprite sheet
@@ -34,63 +39,48 @@ class GameOver(arcade.View):
         frame_height = 32  # Height of each frame
         frame_count = 5  # Total number of frames in the sprite sheet
 
-        for i in range(frame_count):
-            x_frame = i * frame_width
-            texture = arcade.load_texture(
-                sprite_sheet_path,
-                x=x_frame,
-                y=0,
-                width=frame_width,
-                height=frame_height
-            )
-            self.coin_textures.append(texture)
+        self.coin_textures = list(load_frame_strip(sprite_sheet_path, frame_width, frame_height, frame_count))
+
+    def build_overlay(self):
+        """Create the labels and the coin counter icon once."""
+        rounded_final_score = round(self.final_score)
+        self.overlay.add_text("final_score", f"Final Score: {rounded_final_score}", SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2 + 250,
+                              arcade.color.WHITE, font_size=30, anchor_x="center")
+
+        # Total coins collected with animated coin
+        coin_x = SCREEN_WIDTH / 15
+        coin_y = SCREEN_HEIGHT - 45
+        coin_icon = arcade.Sprite(texture=self.coin_textures[self.coin_frame_index])
+        coin_icon.center_x = coin_x - 20
+        coin_icon.center_y = coin_y + 13
+        self.overlay.add_sprite("coin_icon", coin_icon)
+        self.overlay.add_text("coins", self.total_coins_collected, coin_x, coin_y,
+                              arcade.color.RED_ORANGE, font_size=25, anchor_x="left")
+
+        self.overlay.add_text("hint", "Press ENTER to return home, R to retry", SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2 - 150,
+                              arcade.color.LIGHT_GRAY, font_size=20, anchor_x="center")
+
+    def reset(self, final_score):
+        """Registry hook: show the score of the run that just ended."""
+        self.final_score = final_score
+        self.overlay.set_text("final_score", f"Final Score: {round(final_score)}")
 
     def on_show(self):
         """Called when this view is shown."""
         arcade.set_background_color(arcade.color.SKY_BLUE)
-        self.save_score()
-
-        # Load background layers
-        for i in range(1, 5):  # Load Background1.png to Background4.png
-            layer = arcade.load_texture(f"assets/images/background/Background{i}.png")
-            self.background_layers.append(layer)
-
-        # Load total coins collected
-        try:
-            with open("game_watcher/total_coins.txt", "r") as file:
-                self.total_coins_collected = int(file.read().strip())
-        except FileNotFoundError:
-            self.total_coins_collected = 0
-
-    def save_score(self):
-        """Save the player's score to a file."""
-        # Ensure the game_watcher directory exists
-        os.makedirs("game_watcher", exist_ok=True)
-
-        # Convert the score to an integer
-        final_score_int = round(self.final_score)
-
-        # Write the score to the scores.txt file
-        if not os.path.exists("game_watcher/scores.txt"):
-            with open("game_watcher/scores.txt", "w") as file:
-                file.write(f"{final_score_int}\n")
-        else:
-            with open("game_watcher/scores.txt", "a") as file:
-                file.write(f"{final_score_int}\n")
 
+    def enter(self):
+        """Registry hook: refresh the coin total on every visit."""
+        # Total coins collected, from the in-memory profile
+        self.total_coins_collected = profile_store.get_total_coins()
+        self.overlay.set_text("coins", self.total_coins_collected)
 
     def on_draw(self):
         """Render the Game Over screen."""
         self.clear()
 
-        # Draw the Background Layers from the utils.py file
-        draw_parallax_background(
-                self.background_layers,
-                self.background_offsets,
-                self.background_speeds,
-                SCREEN_WIDTH,
-                SCREEN_HEIGHT,
-            )
+        # Draw the background layers
+        self.background.draw()
         
         # Draw the Game Over image scaled to the window size
         arcade.draw_lrwh_rectangle_textured(
@@ -101,38 +91,25 @@ class GameOver(arcade.View):
             self.game_over_image
         )
 
-        # Display final score
-        rounded_final_score = round(self.final_score)
-        arcade.draw_text(f"Final Score: {rounded_final_score}", SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2 + 250,
-                         arcade.color.WHITE, font_size=30, anchor_x="center")
-        
-        # Draw total coins collected with animated coin
-        coin_x = SCREEN_WIDTH / 15
-        coin_y = SCREEN_HEIGHT - 45
-        arcade.draw_texture_rectangle(
-            coin_x - 20, coin_y + 13, 32, 32, self.coin_textures[self.coin_frame_index]
-        )
-        arcade.draw_text(f"{self.total_coins_collected}", coin_x, coin_y,
-                        arcade.color.RED_ORANGE, font_size=25, anchor_x="left")
-
-        # Display restart instructions
-        arcade.draw_text("Press ENTER to return home", SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2 - 150,
-                         arcade.color.LIGHT_GRAY, font_size=20, anchor_x="center")
+        # Final score, coin counter, restart instructions and cursor
+        self.overlay.draw()
 
     def on_update(self, delta_time):
         """Update the background scrolling and coin animation."""
-        for i in range(len(self.background_layers)):
-            self.background_offsets[i] += self.background_speeds[i]
+        self.background.scroll()
         
         # Update coin animation
         self.coin_frame_time += delta_time
         if self.coin_frame_time > self.coin_frame_duration:
             self.coin_frame_time = 0
             self.coin_frame_index = (self.coin_frame_index + 1) % len(self.coin_textures)
+            self.overlay.sprites["coin_icon"].texture = self.coin_textures[self.coin_frame_index]
 
     def on_key_press(self, key, modifiers):
         """Handle key press for restarting the game."""
         if key == arcade.key.ENTER:
-            from menus.title import Title
-            title_view = Title()
-            self.window.show_view(title_view)
+            views.show("title")
+        elif key == arcade.key.R:
+            # Rewind the game view to the start of the same run
+            game = views.get("game")
+            views.show("game", seed=game.seed, snapshot=game.start_snapshot)
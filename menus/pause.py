@@ -1,20 +1,28 @@
 import arcade
 from utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from utils.overlay import Overlay
 
 class Pause(arcade.View):
-    def __init__(self, game_view):
+    def __init__(self, game_view=None):
         super().__init__()
         self.game_view = game_view  # Reference to the main game view
 
+        self.overlay = Overlay()
+        self.overlay.add_text("title", "Game Paused", SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2 + 50,
+                              arcade.color.WHITE, font_size=40, anchor_x="center")
+        self.overlay.add_text("hint", "Press ESC to Resume", SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2 - 50,
+                              arcade.color.LIGHT_GRAY, font_size=20, anchor_x="center")
+
+    def reset(self, game_view):
+        """Registry hook: pause the given game view."""
+        self.game_view = game_view
+
     def on_show(self):
         arcade.set_background_color(arcade.color.GRAY)
 
     def on_draw(self):
         self.clear()
-        arcade.draw_text("Game Paused", SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2 + 50,
-                         arcade.color.WHITE, font_size=40, anchor_x="center")
-        arcade.draw_text("Press ESC to Resume", SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2 - 50,
-                         arcade.color.LIGHT_GRAY, font_size=20, anchor_x="center")
+        self.overlay.draw()
 
     def on_key_press(self, key, modifiers):
         if key == arcade.key.ESCAPE:
@@ -1,15 +1,19 @@
+import os
 import arcade
 from utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT, GAME_RED
-from utils.util import draw_parallax_background
+from utils.parallax import ParallaxBackground
+from utils.frame_cache import load_frame_strip, load_scaled_image
+from utils.overlay import Overlay
+from utils.profile_store import profile_store
+from utils.view_registry import views
+from core.snapshot import read_snapshot, SUSPEND_FILE
 import time
 import random
 
 class Title(arcade.View):
     def __init__(self):
         super().__init__()
-        self.background_layers = []
-        self.background_speeds = [0.05, 0.125, 0.25, 0.5]  # Parallax speeds
-        self.background_offsets = [0, 0, 0, 0]  # Track each layer's horizontal offset
+        self.background = ParallaxBackground([0.05, 0.125, 0.25, 0.5], SCREEN_WIDTH, SCREEN_HEIGHT)
 
         # Button properties
         self.button_center_x = SCREEN_WIDTH / 2
@@ -20,7 +24,7 @@ class Title(arcade.View):
         self.leaderboard = []
 
         # Load the title image
-        self.title_image = arcade.load_texture("assets/images/game/menus/TitleMenu-title.png")
+        self.title_image = load_scaled_image("assets/images/game/menus/TitleMenu-title.png", SCREEN_WIDTH, SCREEN_HEIGHT)
 
         self.total_coins_collected = 0
 
@@ -41,6 +45,10 @@ class Title(arcade.View):
 
         # Load the coin animation frames
         self.load_coin_animation()
+
+        # Retained text and HUD sprites
+        self.overlay = Overlay()
+        self.build_overlay()
         
     def on_mouse_motion(self, x, y, dx, dy):
         """Track mouse movement."""
@@ -54,54 +62,54 @@ class Title(arcade.View):
         frame_height = 32  # Height of each frame
         frame_count = 5  # Total number of frames in the sprite sheet
 
-        for i in range(frame_count):
-            x_frame = i * frame_width
-            texture = arcade.load_texture(
-                sprite_sheet_path,
-                x=x_frame,
-                y=0,
-                width=frame_width,
-                height=frame_height,
-            )
-            self.coin_textures.append(texture)
+        self.coin_textures = list(load_frame_strip(sprite_sheet_path, frame_width, frame_height, frame_count))
+
+    def build_overlay(self):
+        """Create the labels and the coin counter icon once."""
+        self.overlay.add_text("freeplay", "Freeplay", self.button_center_x, self.button_center_y,
+                              arcade.color.BLACK, font_size=20, anchor_x="center", anchor_y="center")
+        self.overlay.add_text("leaderboard", "Leaderboard:", SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2 + 250,
+                              GAME_RED, font_size=35, anchor_x="center")
+        self.overlay.add_text("resume", "", self.button_center_x, self.button_center_y + 45,
+                              GAME_RED, font_size=16, anchor_x="center", anchor_y="center")
+
+        # Total coins collected with animated coin
+        coin_x = SCREEN_WIDTH / 15
+        coin_y = SCREEN_HEIGHT - 45
+        coin_icon = arcade.Sprite(texture=self.coin_textures[self.coin_frame_index])
+        coin_icon.center_x = coin_x - 20
+        coin_icon.center_y = coin_y + 13
+        self.overlay.add_sprite("coin_icon", coin_icon)
+        self.overlay.add_text("coins", self.total_coins_collected, coin_x, coin_y,
+                              GAME_RED, font_size=25, anchor_x="left")
 
     def on_show(self):
         """Called when this view is shown."""
         arcade.set_background_color(arcade.color.SKY_BLUE)
 
-        # Load background layers
-        for i in range(1, 5):  # Load Background1.png to Background4.png
-            layer = arcade.load_texture(f"assets/images/background/Background{i}.png")
-            self.background_layers.append(layer)
-
-        # Add the title image as the topmost background layer
-        title_layer = arcade.load_texture("assets/images/game/menus/TitleMenu-title.png")
-        self.background_layers.append(title_layer)
-        self.background_speeds.append(0)  # No movement for the title image
-        self.background_offsets.append(0)  # Static offset
-
-        # Load total coins collected
-        try:
-            with open("game_watcher/total_coins.txt", "r") as file:
-                self.total_coins_collected = int(file.read().strip())
-        except FileNotFoundError:
-            self.total_coins_collected = 0
+    def enter(self):
+        """Registry hook: refresh the coin total and leaderboard on every visit."""
+        # Total coins collected, from the in-memory profile
+        self.total_coins_collected = profile_store.get_total_coins()
 
         # Load leaderboard scores
         self.load_scores()
 
+        # Offer to resume a run suspended when the game was last closed
+        suspended = os.path.exists(os.path.join(profile_store.directory, SUSPEND_FILE))
+        self.overlay.set_text("resume", "Press R to resume your last run" if suspended else "")
+
+        self.overlay.set_text("coins", self.total_coins_collected)
+        for i, score in enumerate(self.leaderboard):
+            self.overlay.add_text(f"score_{i}", f"{i + 1}....{score}", SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2 + 190 - i * 30,
+                                  GAME_RED, font_size=20, anchor_x="center")
+
     def on_draw(self):
         """Render the title screen."""
         self.clear()
 
         # Draw background layers
-        draw_parallax_background(
-            self.background_layers,
-            self.background_offsets,
-            self.background_speeds,
-            SCREEN_WIDTH,
-            SCREEN_HEIGHT,
-        )
+        self.background.draw()
 
         # Draw the title image scaled to the window size
         arcade.draw_lrwh_rectangle_textured(
@@ -129,84 +137,41 @@ class Title(arcade.View):
             self.button_height,
             button_color,
         )
-        
-        arcade.draw_text(
-            "Freeplay",
-            self.button_center_x,
-            self.button_center_y,
-            arcade.color.BLACK,
-            font_size=20,
-            anchor_x="center",
-            anchor_y="center",
-        )
-        
-        # Draw leaderboard title
-        arcade.draw_text(
-            "Leaderboard:",
-            SCREEN_WIDTH / 2,
-            SCREEN_HEIGHT / 2 + 250,
-            GAME_RED,
-            font_size=35,
-            anchor_x="center",
-        )
-        for i, score in enumerate(self.leaderboard):
-            arcade.draw_text(
-                f"{i + 1}....{score}",
-                SCREEN_WIDTH / 2,
-                SCREEN_HEIGHT / 2 + 190 - i * 30,
-                GAME_RED,
-                font_size=20,
-                anchor_x="center",
-            )
 
-
-        # Draw total coins collected with animated coin
-        coin_x = SCREEN_WIDTH / 15
-        coin_y = SCREEN_HEIGHT - 45
-        arcade.draw_texture_rectangle(
-            coin_x - 20, coin_y + 13, 32, 32, self.coin_textures[self.coin_frame_index]
-        )
-        arcade.draw_text(
-            f"{self.total_coins_collected}",
-            coin_x,
-            coin_y,
-            GAME_RED,
-            font_size=25,
-            anchor_x="left",
-        )
+        # Button label, leaderboard, coin counter and cursor
+        self.overlay.draw()
 
     def on_update(self, delta_time):
         """Update the background scrolling."""
-        for i in range(len(self.background_layers)):
-            self.background_offsets[i] += self.background_speeds[i]
+        self.background.scroll()
 
         # Update coin animation
         self.coin_frame_time += delta_time
         if self.coin_frame_time > self.coin_frame_duration:
             self.coin_frame_time = 0
             self.coin_frame_index = (self.coin_frame_index + 1) % len(self.coin_textures)
+            self.overlay.sprites["coin_icon"].texture = self.coin_textures[self.coin_frame_index]
 
     def on_mouse_press(self, x, y, button, modifiers):
         """Handle mouse click for the start button."""
         if self.button_center_x - self.button_width / 2 < x < self.button_center_x + self.button_width / 2 and \
            self.button_center_y - self.button_height / 2 < y < self.button_center_y + self.button_width / 2:
-            from core.game_window import GameWindow
-            game_view = GameWindow()
-            game_view.setup()
-
-            # Transition to the game view
-            self.window.show_view(game_view)
+            # Start a new run on the game view built on the first visit
+            views.show("game")
     
-    def load_scores(self):
-        """Load the leaderboard scores from a file."""
-        try:
-            with open("game_watcher/scores.txt", "r") as file:
-                self.leaderboard = [int(line.strip()) for line in file.readlines()]
-            self.leaderboard = self.leaderboard[:3]  # Only show the top 5 scores
-        except FileNotFoundError:
-            self.leaderboard = []  # No scores available
-            print("No scores file found. Starting fresh leaderboard.")
-        except Exception as e:
-            self.leaderboard = []
-            print(f"Error loading leaderboard scores: {e}")
+    def on_key_press(self, key, modifiers):
+        """Resume the suspended run with R."""
+        if key == arcade.key.R:
+            path = os.path.join(profile_store.directory, SUSPEND_FILE)
+            snapshot = read_snapshot(path)
+            if snapshot is None:
+                return
+            try:
+                os.remove(path)  # A suspended run can only be resumed once
+            except OSError as e:
+                print(f"Error removing suspended run: {e}")
+            views.show("game", snapshot=snapshot)
 
+    def load_scores(self):
+        """Load the leaderboard scores from the profile store."""
+        self.leaderboard = profile_store.get_scores(limit=3)  # Only show the top 3 scores
@@ -0,0 +1,80 @@
+class AnimationClock:
+    """Shared clock of one animation definition: a texture strip played at a fixed frame duration.
+
+    Every sprite playing the strip shows frame (clock frame + its phase) % frame count, so the
+    clock is advanced once per tick for all of them. Textures are only reassigned on the ticks
+    where the clock actually moves to a new frame, and then only for this clock's sprites.
+    """
+
+    def __init__(self, textures, frame_duration):
+        self.textures = textures
+        self.frame_duration = frame_duration
+        self.time = 0.0
+        self.frame = 0  # Frames elapsed on this clock
+        self.sprites = {}  # Sprite -> phase offset in frames
+
+    def add(self, sprite, phase=None):
+        """Start playing on a sprite; without a phase the sprite starts on the first frame."""
+        if phase is None:
+            phase = -self.frame % len(self.textures)
+        self.sprites[sprite] = phase
+        self.show(sprite, (self.frame + phase) % len(self.textures))
+
+    def remove(self, sprite):
+        self.sprites.pop(sprite, None)
+
+    def show(self, sprite, index):
+        sprite.current_frame = index
+        sprite.texture = self.textures[index]
+
+    def advance(self, delta_time):
+        """Move the clock forward; returns how many sprites changed texture."""
+        self.time += delta_time
+        frame = int(self.time / self.frame_duration)
+        if frame == self.frame:
+            return 0
+        self.frame = frame
+        count = len(self.textures)
+        for sprite, phase in self.sprites.items():
+            self.show(sprite, (frame + phase) % count)
+        return len(self.sprites)
+
+
+class AnimationSystem:
+    """The animation clocks of one view, one per distinct strip and frame duration.
+
+    Sprites register with add() when they appear and remove() when they go away; they need
+    `textures` and `frame_duration` attributes, and get `current_frame` and `texture` set.
+    Advancing costs one check per animation definition per tick, however many sprites play it.
+    """
+
+    def __init__(self):
+        self.clocks = {}  # (textures, frame duration) -> AnimationClock
+        self.clock_of = {}  # Sprite -> the clock it plays on
+        self.texture_swaps = 0  # Texture assignments made by advance()
+
+    def add(self, sprite, phase=None):
+        """Play a sprite's animation on the shared clock of its strip."""
+        key = (tuple(sprite.textures), sprite.frame_duration)
+        clock = self.clocks.get(key)
+        if clock is None:
+            clock = self.clocks[key] = AnimationClock(key[0], sprite.frame_duration)
+        self.remove(sprite)
+        clock.add(sprite, phase)
+        self.clock_of[sprite] = clock
+
+    def remove(self, sprite):
+        clock = self.clock_of.pop(sprite, None)
+        if clock is not None:
+            clock.remove(sprite)
+
+    def advance(self, delta_time):
+        for clock in self.clocks.values():
+            self.texture_swaps += clock.advance(delta_time)
+
+    def get_stats(self):
+        return {
+            "clocks": len(self.clocks),
+            "sprites": len(self.clock_of),
+            "texture_swaps": self.texture_swaps,
+        }
@@ -0,0 +1,101 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+import arcade
+from utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT, BUG_SCALE
+from utils.frame_cache import load_frame_strip, load_scaled_image
+from utils.sound_bank import sound_bank, SOUND_MANIFEST
+
+# Every asset decoded at startup: (kind, arguments). Decoded results land in the shared caches
+# the views read from (arcade's texture cache, the frame cache and the sound bank), so every
+# view picks them up without decoding anything again.
+ASSET_MANIFEST = [
+    ("texture", ("assets/images/background/Background1.png",)),
+    ("texture", ("assets/images/background/Background2.png",)),
+    ("texture", ("assets/images/background/Background3.png",)),
+    ("texture", ("assets/images/background/Background4.png",)),
+    ("texture", ("assets/images/game/cursor.png",)),
+    ("image", ("assets/images/game/menus/TitleMenu-title.png", SCREEN_WIDTH, SCREEN_HEIGHT)),
+    ("image", ("assets/images/game/menus/GameOver.png", SCREEN_WIDTH, SCREEN_HEIGHT)),
+    ("strip", ("assets/images/characters/run_side.png", 150, 149, 8)),
+    ("strip", ("assets/images/characters/jump.png", 150, 149, 2)),
+    ("strip", ("assets/images/world_assets/obstacle.png", 32, 32, 5)),
+    ("strip", ("assets/images/world_assets/coin.png", 32, 32, 5)),  # Menu coin counters
+    ("strip", ("assets/images/world_assets/coin.png", 32, 32, 5, False, 0.5)),
+    ("strip", ("assets/images/world_assets/lightning_bug.png", 32, 32, 6, False, BUG_SCALE)),
+    ("strip", ("assets/images/world_assets/lightning_bug.png", 32, 32, 6, True, BUG_SCALE)),
+    ("strip", ("assets/images/world_assets/tiles/GroundTile_Sprite.png", 640, 1000, 5, False, 0.1)),
+] + [("sound", (name,)) for name in SOUND_MANIFEST]
+
+# Decoding is mostly PIL and audio decoders, which release the GIL for the heavy parts
+LOADER_WORKERS = 4
+
+
+def load_asset(kind, args):
+    """Decode one manifest entry into its shared cache; returns False if it could not be loaded."""
+    if kind == "texture":
+        arcade.load_texture(*args)
+    elif kind == "image":
+        load_scaled_image(*args)
+    elif kind == "strip":
+        load_frame_strip(*args)
+    elif kind == "sound":
+        return sound_bank.load(*args) is not None  # The sound bank reports its own errors
+    return True
+
+
+class AssetLoader:
+    """Decodes the asset manifest on worker threads and reports real progress.
+
+    Nothing here touches OpenGL: textures are uploaded to the GPU later, on the main thread,
+    the first time a view draws them.
+    """
+
+    def __init__(self, manifest=ASSET_MANIFEST, workers=LOADER_WORKERS):
+        self.manifest = manifest
+        self.workers = workers
+        self.executor = None
+        self.futures = []
+        self.timings = {}  # Asset label -> seconds spent decoding it
+        self.failed = []  # Labels of assets that could not be loaded
+        self.started_at = None
+        self.finished_at = None
+
+    def start(self):
+        """Queue every asset on the worker pool."""
+        self.started_at = time.perf_counter()
+        self.executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="asset-loader")
+        self.futures = [self.executor.submit(self.load, kind, args) for kind, args in self.manifest]
+
+    def load(self, kind, args):
+        label = f"{kind}:{args[0]}"
+        start = time.perf_counter()
+        try:
+            if not load_asset(kind, args):
+                self.failed.append(label)
+        except Exception as e:
+            print(f"Error loading {label}: {e}")
+            self.failed.append(label)
+        self.timings[label] = time.perf_counter() - start
+
+    def get_progress(self):
+        """Return the fraction of manifest entries that are finished."""
+        if not self.futures:
+            return 0.0
+        return sum(1 for future in self.futures if future.done()) / len(self.futures)
+
+    def is_done(self):
+        """Return True once every asset has been decoded (or has failed)."""
+        if self.finished_at is not None:
+            return True
+        if not self.futures or not all(future.done() for future in self.futures):
+            return False
+        self.finished_at = time.perf_counter()
+        self.executor.shutdown(wait=False)
+        return True
+
+    def get_elapsed(self):
+        """Return the loading time so far, or the total once finished."""
+        if self.started_at is None:
+            return 0.0
+        end = self.finished_at if self.finished_at is not None else time.perf_counter()
+        return end - self.started_at
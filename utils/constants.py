@@ -12,4 +12,10 @@ BUG_MIN_COUNT = 5
 BUG_MAX_COUNT = 7
 BUG_SCALE = 0.3
 BUG_SPEED = -2
+BUG_SPAWN_MULTIPLIER = 1  # Bug clusters per spawn; raise on higher-quality settings
 GAME_RED = (218, 94, 83)  # Equivalent to '#da5e53' in RGB
+OBSTACLE_POOL_SIZE = 32  # Idle obstacles kept for reuse
+COIN_POOL_SIZE = 32  # Idle coins kept for reuse
+BUG_POOL_SIZE = 96  # Idle lightning bugs kept for reuse
+SIMULATION_TICK = 1 / 60  # Fixed simulation step in seconds, independent of the render rate
+MAX_SIMULATION_STEPS = 5  # Catch-up cap per rendered frame before the backlog is dropped
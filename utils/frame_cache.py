@@ -0,0 +1,80 @@
+import threading
+import arcade
+from utils.texture_variants import scaled_size, prepare_strip, prepare_image
+
+# Process-wide cache of sliced sprite-sheet strips.
+# Keyed by (sheet path, frame width, frame height, frame count, mirrored, scale) so every
+# entity of the same type shares one tuple of textures instead of slicing its own.
+_strips = {}
+_stats = {"hits": 0, "misses": 0, "bytes": 0}
+_lock = threading.Lock()  # Strips may be loaded from asset loader threads
+
+
+def load_frame_strip(sprite_sheet_path, frame_width, frame_height, frame_count, mirrored=False, scale=1.0):
+    """Return the frames of a horizontal sprite-sheet strip, slicing the sheet only on first use.
+
+    With a scale below 1 the frames come from a down-scaled variant of the sheet, so they are
+    already at display resolution; sprites then draw them at scale / texture_scale(frames).
+    """
+    key = (sprite_sheet_path, frame_width, frame_height, frame_count, mirrored, scale)
+    with _lock:
+        strip = _strips.get(key)
+        if strip is not None:
+            _stats["hits"] += 1
+            return strip
+        _stats["misses"] += 1
+
+    if scale < 1:
+        target_width, target_height = scaled_size(frame_width, frame_height, scale)
+        variant_path = prepare_strip(sprite_sheet_path, frame_width, frame_height, frame_count,
+                                     target_width, target_height)
+        if variant_path is not None:
+            sprite_sheet_path, frame_width, frame_height = variant_path, target_width, target_height
+
+    frames = []
+    for i in range(frame_count):
+        texture = arcade.load_texture(
+            sprite_sheet_path,
+            x=i * frame_width,
+            y=0,
+            width=frame_width,
+            height=frame_height,
+            flipped_horizontally=mirrored,
+            hit_box_algorithm=None,  # Collision shapes come from utils.hit_boxes, measured once per sheet
+        )
+        frames.append(texture)
+
+    with _lock:
+        if key not in _strips:
+            _strips[key] = tuple(frames)
+            _stats["bytes"] += frame_width * frame_height * 4 * frame_count  # RGBA bytes held by the frames
+        return _strips[key]
+
+
+def texture_scale(strip, frame_width):
+    """Return how much smaller the strip's frames are than the source frames."""
+    return strip[0].width / frame_width
+
+
+def load_scaled_image(path, width, height):
+    """Return a texture of a whole image pre-scaled to the size it is drawn at."""
+    return arcade.load_texture(prepare_image(path, width, height) or path)
+
+
+def get_cache_stats():
+    """Return the hit/miss counters and the memory held by cached frames."""
+    return {
+        "hits": _stats["hits"],
+        "misses": _stats["misses"],
+        "strips": len(_strips),
+        "frames": sum(len(strip) for strip in _strips.values()),
+        "bytes": _stats["bytes"],
+    }
+
+
+def clear_cache():
+    """Drop every cached strip and reset the counters."""
+    _strips.clear()
+    _stats["hits"] = 0
+    _stats["misses"] = 0
+    _stats["bytes"] = 0
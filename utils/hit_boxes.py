@@ -0,0 +1,133 @@
+import json
+import os
+import threading
+import numpy as np
+from PIL import Image
+from utils.texture_variants import source_hash
+
+# Collision shapes are measured from sprite-sheet alpha once and kept in a sidecar file next to
+# each sheet, e.g. assets/images/world_assets/coin.png -> coin.hitboxes.json
+HIT_BOX_SUFFIX = ".hitboxes.json"
+HIT_BOX_FORMAT_VERSION = 2
+
+# The sheet each collision shape is measured from. A shape covers every frame of its sheet: the
+# simulation runs without the views' animation clocks (replays are replayed headless), so it
+# cannot know which frame is on screen, only which sheet. The player collides with its running
+# shape on the ground and its jumping shape in the air, like the textures it shows.
+ENTITY_SHEETS = {
+    "player": ("assets/images/characters/run_side.png", 150, 149, 8),
+    "player_jump": ("assets/images/characters/jump.png", 150, 149, 2),
+    "obstacle": ("assets/images/world_assets/obstacle.png", 32, 32, 5),
+    "coin": ("assets/images/world_assets/coin.png", 32, 32, 5),
+}
+
+# Shape tier of each entity type: "aabb" for a plain box, "hull" for an octagonal hull that
+# follows the silhouette's corners (bounded on the x, y and both diagonal axes)
+SHAPE_TIERS = {
+    "player": "hull",
+    "player_jump": "hull",
+    "obstacle": "hull",
+    "coin": "aabb",
+}
+
+_shapes = {}  # Kind -> shape, built once per run
+_lock = threading.Lock()
+
+
+def sidecar_path(sheet_path):
+    return os.path.splitext(sheet_path)[0] + HIT_BOX_SUFFIX
+
+
+def measure_frame(alpha, frame_width, frame_height):
+    """Return the bounds of the opaque pixels of one frame, or None if it is empty.
+
+    Bounds are (left, right, bottom, top, sum_min, sum_max, diff_min, diff_max): the interval
+    the pixels cover on the x and y axes and on the x + y and x - y diagonals, which is the
+    octagonal hull of the silhouette. Coordinates are relative to the frame center with y up,
+    like arcade hit box points, and cover whole pixels, so one opaque pixel still has an area.
+    """
+    rows, columns = np.nonzero(alpha)
+    if len(rows) == 0:
+        return None
+    left = columns - frame_width / 2  # Pixel edges
+    right = left + 1
+    top = frame_height / 2 - rows
+    bottom = top - 1
+    return (
+        float(left.min()), float(right.max()), float(bottom.min()), float(top.max()),
+        float((left + bottom).min()), float((right + top).max()),  # x + y
+        float((left - top).min()), float((right - bottom).max()),  # x - y
+    )
+
+
+def measure_sheet(sheet_path, frame_width, frame_height, frame_count):
+    """Return the bounds covering every frame of a horizontal sprite-sheet strip, or None if it is empty."""
+    with Image.open(sheet_path) as image:
+        alpha = np.asarray(image.convert("RGBA"))[:, :, 3]
+    frames = [
+        measure_frame(alpha[:frame_height, i * frame_width:(i + 1) * frame_width], frame_width, frame_height)
+        for i in range(frame_count)
+    ]
+    frames = [bounds for bounds in frames if bounds is not None]
+    if not frames:
+        return None
+    return tuple(
+        min(values) if i % 2 == 0 else max(values) for i, values in enumerate(zip(*frames))
+    )
+
+
+def load_sheet_bounds(sheet_path, frame_width, frame_height, frame_count):
+    """Return the bounds of a sprite sheet, measuring it only when its sidecar is stale.
+
+    The sidecar records the sheet's content hash and frame layout; editing the sheet or slicing
+    it differently rebuilds it.
+    """
+    digest = source_hash(sheet_path)
+    layout = [frame_width, frame_height, frame_count]
+    path = sidecar_path(sheet_path)
+    try:
+        with open(path) as file:
+            data = json.load(file)
+        if (data.get("version") == HIT_BOX_FORMAT_VERSION and data.get("source_hash") == digest
+                and data.get("layout") == layout):
+            return tuple(data["bounds"]) if data["bounds"] is not None else None
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"Error reading hit boxes '{path}', measuring again: {e}")
+
+    bounds = measure_sheet(sheet_path, frame_width, frame_height, frame_count)
+    data = {"version": HIT_BOX_FORMAT_VERSION, "source_hash": digest, "layout": layout, "bounds": bounds}
+    try:
+        # Write next to the final name and swap it in, so a crash never leaves a torn file
+        temp_path = f"{path}.{os.getpid()}-{threading.get_ident()}.tmp"
+        with open(temp_path, "w") as file:
+            json.dump(data, file)
+        os.replace(temp_path, path)
+    except Exception as e:
+        print(f"Error saving hit boxes '{path}': {e}")
+    return bounds
+
+
+def box_bounds(box):
+    """Return the bounds of a plain (left, right, bottom, top) box in the measure_frame() layout."""
+    left, right, bottom, top = box
+    return (left, right, bottom, top, left + bottom, right + top, left - top, right - bottom)
+
+
+def get_entity_shapes():
+    """Return the collision shape of each entity type, in its SHAPE_TIERS tier.
+
+    A box's diagonal bounds come from its corners, a hull keeps the measured ones. Types whose
+    sheets cannot be read are left out, so callers should keep a fallback box.
+    """
+    with _lock:
+        if not _shapes:
+            for kind, sheet in ENTITY_SHEETS.items():
+                try:
+                    bounds = load_sheet_bounds(*sheet)
+                    if bounds is not None:
+                        _shapes[kind] = bounds if SHAPE_TIERS[kind] == "hull" else box_bounds(bounds[:4])
+                except Exception as e:
+                    print(f"Error loading hit boxes for {kind}: {e}")
+        return dict(_shapes)
@@ -0,0 +1,70 @@
+from bisect import bisect_left
+
+# How many distinct best scores the index keeps
+LEADERBOARD_SIZE = 10
+
+
+class Leaderboard:
+    """Bounded top-K index of distinct scores plus running stats over every recorded run.
+
+    The best scores are kept negated in an ascending list, so inserting is a binary search over
+    at most LEADERBOARD_SIZE entries and a top-N query is a slice, however many runs exist.
+    """
+
+    def __init__(self, capacity=LEADERBOARD_SIZE):
+        self.capacity = capacity
+        self.negated_top = []  # -score for the best distinct scores, best first
+        self.runs = 0  # Runs recorded, including ones that never made the top
+        self.total = 0  # Sum of every recorded score
+
+    def insert(self, score):
+        """Record a run's score; returns True if it entered the top scores."""
+        self.runs += 1
+        self.total += score
+
+        key = -score
+        top = self.negated_top
+        index = bisect_left(top, key)
+        if index >= self.capacity or (index < len(top) and top[index] == key):
+            return False
+        top.insert(index, key)
+        if len(top) > self.capacity:
+            top.pop()
+        return True
+
+    def best(self, limit=None):
+        """Return up to limit of the best distinct scores, best first."""
+        top = self.negated_top if limit is None else self.negated_top[:limit]
+        return [-key for key in top]
+
+    def get_stats(self):
+        """Return run count, best and mean score over the whole history."""
+        return {
+            "runs": self.runs,
+            "best": -self.negated_top[0] if self.negated_top else 0,
+            "mean": self.total / self.runs if self.runs else 0.0,
+        }
+
+    ################################################################################################
+    # Index file
+    ################################################################################################
+    def dumps(self, log_offset):
+        """Serialize the index, noting how many bytes of the score log it already covers."""
+        lines = [f"offset {log_offset}", f"runs {self.runs}", f"total {self.total}"]
+        lines += [str(score) for score in self.best()]
+        return "\n".join(lines) + "\n"
+
+    def loads(self, text):
+        """Restore the index from dumps() output and return the log offset it covers."""
+        values = {}
+        top = []
+        for line in text.splitlines():
+            parts = line.split()
+            if len(parts) == 2:
+                values[parts[0]] = int(parts[1])
+            elif len(parts) == 1:
+                top.append(-int(parts[0]))
+        self.runs = values.get("runs", 0)
+        self.total = values.get("total", 0)
+        self.negated_top = sorted(top)[:self.capacity]
+        return values.get("offset", 0)
@@ -0,0 +1,90 @@
+import arcade
+import pyglet
+
+# Font used by arcade.draw_text, kept so retained labels look the same
+DEFAULT_FONT = ("calibri", "arial")
+
+
+class Overlay:
+    """Retained HUD layer drawn on top of a view.
+
+    Text labels are laid out once and only re-laid out when their value changes, and every HUD
+    sprite, including the custom cursor, is drawn in one SpriteList batch. A view builds its
+    overlay once, updates it with set_text() and calls draw() at the end of on_draw().
+    """
+
+    def __init__(self):
+        self.batch = pyglet.graphics.Batch()
+        self.specs = {}  # Name -> label arguments and current text
+        self.labels = {}  # Name -> pyglet label in the shared batch
+        self.sprite_list = arcade.SpriteList()
+        self.sprites = {}  # Name -> HUD sprite
+        self.layouts = 0  # Label layouts performed, including the initial ones
+
+        # Own copy of the window's custom cursor, drawn last so it stays on top
+        self.cursor = None
+        self.cursor_width = 0
+        self.cursor_height = 0
+        window = arcade.get_window()
+        custom_cursor = getattr(window, "custom_cursor", None)
+        if custom_cursor is not None:
+            self.cursor = arcade.Sprite(texture=custom_cursor.texture, scale=custom_cursor.scale)
+            self.cursor_width = custom_cursor.width
+            self.cursor_height = custom_cursor.height
+
+    def add_text(self, name, text, x, y, color=arcade.color.WHITE, font_size=12, anchor_x="left", anchor_y="baseline"):
+        """Create a label, replacing any label of the same name; same arguments as arcade.draw_text.
+
+        The label itself is built on the first draw, so views can be set up without a GL context.
+        """
+        if name in self.labels:
+            self.labels.pop(name).delete()
+        self.specs[name] = dict(
+            text=str(text),
+            x=x,
+            y=y,
+            font_name=DEFAULT_FONT,
+            font_size=font_size,
+            anchor_x=anchor_x,
+            anchor_y=anchor_y,
+            color=arcade.get_four_byte_color(color),
+        )
+
+    def set_text(self, name, text):
+        """Change a label's text, re-laying it out only if the text actually changed."""
+        text = str(text)
+        spec = self.specs[name]
+        if spec["text"] != text:
+            spec["text"] = text
+            label = self.labels.get(name)
+            if label is not None:
+                label.text = text
+                self.layouts += 1
+
+    def build_labels(self):
+        """Lay out every label that has not been built yet."""
+        for name, spec in self.specs.items():
+            if name not in self.labels:
+                self.labels[name] = pyglet.text.Label(batch=self.batch, **spec)
+                self.layouts += 1
+
+    def add_sprite(self, name, sprite):
+        """Add a sprite to the HUD batch."""
+        self.sprites[name] = sprite
+        self.sprite_list.append(sprite)
+
+    def draw(self):
+        """Draw every label and HUD sprite."""
+        if len(self.labels) < len(self.specs):
+            self.build_labels()
+        window = arcade.get_window()
+        with window.ctx.pyglet_rendering():
+            self.batch.draw()
+
+        if self.cursor is not None:
+            # Offset the cursor's position so that the (0,0) point of the image aligns with the mouse
+            self.cursor.center_x = window._mouse_x + self.cursor_width / 2
+            self.cursor.center_y = window._mouse_y - self.cursor_height / 2
+            if not self.cursor.sprite_lists:
+                self.sprite_list.append(self.cursor)
+        self.sprite_list.draw()
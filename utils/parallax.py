@@ -0,0 +1,63 @@
+import arcade
+
+# Background layers shared by every scrolling view, back to front
+BACKGROUND_LAYER_PATHS = [f"assets/images/background/Background{i}.png" for i in range(1, 5)]
+
+
+class ParallaxBackground:
+    """Scrolling background layers kept in one persistent SpriteList.
+
+    Each layer is two screen-sized sprites side by side. The geometry is built once; scrolling
+    only moves the sprites, and the whole background is drawn in a single batched draw call
+    instead of two immediate-mode textured rectangles per layer.
+    """
+
+    def __init__(self, speeds, width, height, layer_paths=BACKGROUND_LAYER_PATHS):
+        self.width = width
+        self.height = height
+        self.speeds = list(speeds)  # Pixels per 60 FPS frame, one per layer
+        self.offsets = [0.0] * len(self.speeds)  # Horizontal offset of each layer
+        self.sprite_list = arcade.SpriteList()
+        self.layer_sprites = []  # (left tile, right tile) per layer
+        self.draw_calls = 0  # Draw calls issued since creation
+
+        for path in layer_paths:
+            texture = arcade.load_texture(path)
+            tiles = []
+            for _ in range(2):
+                sprite = arcade.Sprite(texture=texture)
+                sprite.width = width
+                sprite.height = height
+                sprite.center_y = height / 2
+                self.sprite_list.append(sprite)
+                tiles.append(sprite)
+            self.layer_sprites.append(tuple(tiles))
+        self.place_layers()
+
+    def place_layers(self):
+        """Move every layer's tiles to match its offset."""
+        for (left, right), offset in zip(self.layer_sprites, self.offsets):
+            offset = offset % self.width
+            left.center_x = self.width / 2 - offset
+            right.center_x = self.width * 1.5 - offset
+
+    def scroll(self, frames=1.0):
+        """Advance every layer by its speed times the number of 60 FPS frames elapsed."""
+        for i, speed in enumerate(self.speeds):
+            self.offsets[i] += speed * frames
+        self.place_layers()
+
+    def draw(self):
+        """Draw all layers in one batch."""
+        self.sprite_list.draw()
+        self.draw_calls += 1
+
+    def get_stats(self):
+        """Return the layer count and draw calls per frame, batched versus immediate mode."""
+        return {
+            "layers": len(self.layer_sprites),
+            "sprites": len(self.sprite_list),
+            "draw_calls_per_frame": 1,
+            "immediate_draw_calls_per_frame": 2 * len(self.layer_sprites),
+            "draw_calls": self.draw_calls,
+        }
@@ -0,0 +1,56 @@
+class EntityPool:
+    """Fixed-capacity free list of reusable sprites of a single entity type.
+
+    Entities handed out by the pool must provide a ``reset(x, y)`` method that
+    restores them to their freshly-spawned state.
+    """
+
+    def __init__(self, factory, capacity, prefill=True):
+        self.factory = factory  # Callable that builds a new entity
+        self.capacity = capacity  # Maximum number of idle entities kept
+        self.free = []
+
+        # Pool statistics
+        self.in_use = 0
+        self.high_water = 0  # Most entities in use at the same time
+        self.misses = 0  # Acquires that found the free list empty
+        self.allocated = 0  # Total entities ever built by this pool
+
+        if prefill:
+            for _ in range(capacity):
+                self.free.append(self._build())
+
+    def _build(self):
+        self.allocated += 1
+        return self.factory()
+
+    def acquire(self, x, y):
+        """Take an idle entity (or build one if none are free) and reset it at (x, y)."""
+        if self.free:
+            entity = self.free.pop()
+        else:
+            self.misses += 1
+            entity = self._build()
+
+        entity.reset(x, y)
+        self.in_use += 1
+        if self.in_use > self.high_water:
+            self.high_water = self.in_use
+        return entity
+
+    def release(self, entity):
+        """Return an entity to the pool once it has left every sprite list."""
+        self.in_use -= 1
+        if len(self.free) < self.capacity:
+            self.free.append(entity)
+
+    def get_stats(self):
+        """Return the pool statistics."""
+        return {
+            "capacity": self.capacity,
+            "free": len(self.free),
+            "in_use": self.in_use,
+            "high_water": self.high_water,
+            "misses": self.misses,
+            "allocated": self.allocated,
+        }
@@ -0,0 +1,277 @@
+import atexit
+import os
+import threading
+import time
+from utils.leaderboard import Leaderboard
+
+# Where the player's progress is kept, relative to the game directory
+PROFILE_DIRECTORY = "game_watcher"
+TOTAL_COINS_FILE = "total_coins.txt"
+SCORES_FILE = "scores.txt"  # Append-only log of every run's score
+LEADERBOARD_FILE = "leaderboard.txt"  # Top-K index and stats covering a prefix of the log
+
+# The index is rewritten (compacted) after this many new runs, and on exit
+COMPACT_INTERVAL = 20
+
+# Changes made within this many seconds of each other are written together
+FLUSH_DELAY = 0.5
+
+
+class ProfileStore:
+    """The player's coin total and scores, kept in memory and written behind.
+
+    Reads and updates only touch memory and mark the changed file dirty. A background writer
+    thread wakes up, waits FLUSH_DELAY so bursts of changes coalesce into one write, and replaces
+    each dirty file atomically (temp file + os.replace), so a crash mid-write never leaves a
+    truncated file. Pending changes are flushed on exit.
+
+    Nothing is read until the store is first used, so importing the shared store does not touch
+    the disk and its directory can still be changed before then.
+
+    Scores are appended to a log that keeps the whole history, and a small leaderboard index
+    records the best scores plus how far into the log it reaches. Loading reads the index and
+    only the log entries after it; the index is compacted every COMPACT_INTERVAL runs.
+    """
+
+    def __init__(self, directory=PROFILE_DIRECTORY):
+        self.directory = directory
+        self.total_coins = 0
+        self.leaderboard = Leaderboard()
+        self.pending_scores = []  # Scores not appended to the log yet
+        self.log_offset = 0  # Bytes of the score log written so far
+        self.log_needs_newline = False  # The log ends in a torn line from an interrupted write
+        self.runs_since_compaction = 0  # Logged runs the index on disk does not cover yet
+        self.dirty = set()  # Files with changes not written yet
+        self.flushes = 0  # Writer passes that wrote at least one file
+        self.writes = 0  # Files written
+
+        self.lock = threading.Lock()  # Guards the in-memory data and the dirty set
+        self.write_lock = threading.Lock()  # One flush at a time
+        self.wake = threading.Event()
+        self.closed = False
+        self.writer = None
+        self.loaded = False
+
+    def ensure_loaded(self):
+        """Read the profile on first use and flush it on exit from then on."""
+        if self.loaded:
+            return
+        with self.write_lock:
+            if not self.loaded:
+                self.load()
+                atexit.register(self.close)
+                self.loaded = True
+
+    def path(self, file_name):
+        return os.path.join(self.directory, file_name)
+
+    ################################################################################################
+    # Loading
+    ################################################################################################
+    def load(self):
+        """Read the coin total and scores from disk."""
+        try:
+            with open(self.path(TOTAL_COINS_FILE), "r") as file:
+                self.total_coins = int(file.read().strip())
+        except FileNotFoundError:
+            self.total_coins = 0  # Start at 0 if the file doesn't exist
+        except Exception as e:
+            print(f"Error loading total coins: {e}")
+
+        self.load_leaderboard()
+
+    def load_leaderboard(self):
+        """Restore the leaderboard index, then replay only the log entries it does not cover."""
+        try:
+            with open(self.path(LEADERBOARD_FILE), "r") as file:
+                self.log_offset = self.leaderboard.loads(file.read())
+        except FileNotFoundError:
+            self.log_offset = 0  # No index yet: replay the whole log once
+        except Exception as e:
+            print(f"Error loading leaderboard: {e}")
+            self.leaderboard = Leaderboard()
+            self.log_offset = 0
+
+        try:
+            with open(self.path(SCORES_FILE), "rb") as file:
+                if self.log_offset > file.seek(0, os.SEEK_END):
+                    print("Scores file is shorter than the leaderboard index. Rebuilding it.")
+                    self.leaderboard = Leaderboard()
+                    self.log_offset = 0
+                file.seek(self.log_offset)
+                tail = file.read()
+        except FileNotFoundError:
+            print("No scores file found. Starting fresh.")
+            return
+        except Exception as e:
+            print(f"Error loading scores: {e}")
+            return
+
+        complete, _, torn = tail.rpartition(b"\n")
+        for line in complete.decode("utf-8", "replace").splitlines():
+            stripped_line = line.strip()
+            if stripped_line:  # Skip empty lines
+                try:
+                    self.leaderboard.insert(round(float(stripped_line)))  # Handle floats gracefully
+                    self.runs_since_compaction += 1
+                except ValueError:
+                    print(f"Skipping invalid score: {stripped_line}")
+        self.log_offset += len(tail)
+        self.log_needs_newline = bool(torn)  # Never glue the next score onto a torn line
+
+    ################################################################################################
+    # Reading and Updating
+    ################################################################################################
+    def get_total_coins(self):
+        self.ensure_loaded()
+        return self.total_coins
+
+    def get_scores(self, limit=None):
+        """Return the best distinct scores, best first."""
+        self.ensure_loaded()
+        with self.lock:
+            return self.leaderboard.best(limit)
+
+    def get_score_stats(self):
+        """Return run count, best and mean score over every recorded run."""
+        self.ensure_loaded()
+        with self.lock:
+            return self.leaderboard.get_stats()
+
+    def add_coins(self, count=1):
+        """Add collected coins to the total."""
+        self.ensure_loaded()
+        with self.lock:
+            self.total_coins += count
+            self.mark_dirty(TOTAL_COINS_FILE)
+
+    def record_score(self, score):
+        """Log a finished run's score, rounded, and add it to the leaderboard."""
+        rounded_score = round(score)
+        self.ensure_loaded()
+        with self.lock:
+            self.leaderboard.insert(rounded_score)
+            self.pending_scores.append(rounded_score)
+            self.runs_since_compaction += 1
+            self.mark_dirty(SCORES_FILE)
+            if self.runs_since_compaction >= COMPACT_INTERVAL:
+                self.mark_dirty(LEADERBOARD_FILE)
+
+    def mark_dirty(self, file_name):
+        """Queue a file for the writer; call with the lock held."""
+        self.dirty.add(file_name)
+        if self.writer is None and not self.closed:
+            self.writer = threading.Thread(target=self.run_writer, name="profile-writer", daemon=True)
+            self.writer.start()
+        self.wake.set()
+
+    ################################################################################################
+    # Writing
+    ################################################################################################
+    def run_writer(self):
+        """Background loop: wait for changes, let them coalesce, then flush."""
+        while not self.closed:
+            self.wake.wait()
+            if self.closed:
+                break
+            self.wake.clear()
+            time.sleep(FLUSH_DELAY)  # Let further changes pile up
+            self.flush()
+
+    def flush(self):
+        """Write every dirty file now."""
+        with self.write_lock:
+            with self.lock:
+                dirty = self.dirty
+                self.dirty = set()
+                contents = {}
+                if TOTAL_COINS_FILE in dirty:
+                    contents[TOTAL_COINS_FILE] = str(self.total_coins)
+                scores = self.pending_scores if SCORES_FILE in dirty else []
+                self.pending_scores = [] if SCORES_FILE in dirty else self.pending_scores
+                compact = LEADERBOARD_FILE in dirty
+
+            if not contents and not scores and not compact:
+                return
+            for file_name, text in contents.items():
+                try:
+                    self.write_atomic(file_name, text)
+                    self.writes += 1
+                except Exception as e:
+                    print(f"Error saving {file_name}: {e}")
+                    with self.lock:
+                        self.dirty.add(file_name)  # Try again on the next flush
+
+            # The log is appended before the index is rewritten, so the index never covers
+            # scores that are not in the log yet
+            if scores:
+                try:
+                    self.append_scores(scores)
+                    self.writes += 1
+                except Exception as e:
+                    print(f"Error saving {SCORES_FILE}: {e}")
+                    with self.lock:
+                        self.pending_scores = scores + self.pending_scores
+                        self.dirty.add(SCORES_FILE)
+                    compact = False
+            if compact:
+                self.compact()
+            self.flushes += 1
+
+    def append_scores(self, scores):
+        """Append scores to the log; only ever adds whole lines at the end of the file."""
+        os.makedirs(self.directory, exist_ok=True)
+        text = "".join(f"{score}\n" for score in scores)
+        if self.log_needs_newline:
+            text = "\n" + text
+        data = text.encode("utf-8")
+        with open(self.path(SCORES_FILE), "ab") as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        self.log_offset += len(data)
+        self.log_needs_newline = False
+
+    def compact(self):
+        """Rewrite the leaderboard index so it covers the whole log written so far."""
+        with self.lock:
+            if self.pending_scores:
+                # Scores recorded since this flush began are in the leaderboard but not the log
+                self.dirty.add(LEADERBOARD_FILE)
+                return
+            text = self.leaderboard.dumps(self.log_offset)
+            self.runs_since_compaction = 0
+        try:
+            self.write_atomic(LEADERBOARD_FILE, text)
+            self.writes += 1
+        except Exception as e:
+            print(f"Error saving {LEADERBOARD_FILE}: {e}")
+            with self.lock:
+                self.dirty.add(LEADERBOARD_FILE)
+
+    def write_atomic(self, file_name, text):
+        """Replace a file in one step so readers never see a partial write."""
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path(file_name)
+        temp_path = path + ".tmp"
+        with open(temp_path, "w") as file:
+            file.write(text)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, path)
+
+    def close(self):
+        """Stop the writer, write anything still pending and compact the leaderboard index."""
+        self.closed = True
+        self.wake.set()
+        with self.lock:
+            if self.runs_since_compaction or self.pending_scores:
+                self.dirty.add(LEADERBOARD_FILE)
+        self.flush()
+
+    def get_stats(self):
+        return {"flushes": self.flushes, "writes": self.writes, "dirty": len(self.dirty)}
+
+
+# Shared profile store used by every view
+profile_store = ProfileStore()
@@ -0,0 +1,225 @@
+import csv
+import json
+import os
+import time
+from contextlib import nullcontext
+import numpy as np
+
+# Frames of history kept in the ring buffer
+PROFILER_CAPACITY = 600
+
+# Upper bounds on distinct scope and counter names
+MAX_PHASES = 32
+MAX_COUNTERS = 8
+
+# Where exported profiles are written
+PROFILE_EXPORT_DIRECTORY = ".cache/profiles"
+
+# Returned by scope() while the profiler is off, so a disabled scope costs one attribute check
+NULL_SCOPE = nullcontext()
+
+
+class Scope:
+    """Times one named phase; self time only, so nested scopes are not counted twice.
+
+    A scope object is shared by every use of its name, so a scope must not be re-entered
+    inside itself.
+    """
+    __slots__ = ("profiler", "index", "start", "children")
+
+    def __init__(self, profiler, index):
+        self.profiler = profiler
+        self.index = index
+        self.start = 0.0
+        self.children = 0.0  # Time spent in scopes nested inside this one
+
+    def __enter__(self):
+        self.children = 0.0
+        self.profiler.stack.append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.start
+        profiler = self.profiler
+        stack = profiler.stack
+        stack.pop()
+        profiler.current[self.index] += elapsed - self.children
+        if stack:
+            stack[-1].children += elapsed
+        return False
+
+
+class FrameProfiler:
+    """Per-phase frame timings kept in a ring buffer of the last PROFILER_CAPACITY frames.
+
+    Code wraps each phase in `with profiler.scope("name"):`, sets per-frame entity counts with
+    set_count() and the window calls end_frame() once per frame. Each scope records its self
+    time, so the phases of a frame never overlap and whatever is left of the frame time is
+    work outside any scope (event dispatch, buffer swaps, idle time). While disabled, scope()
+    returns a shared no-op context and nothing is recorded.
+    """
+
+    def __init__(self, capacity=PROFILER_CAPACITY):
+        self.enabled = False
+        self.visible = False  # Show the on-screen panel
+        self.capacity = capacity
+        self.phases = []  # Scope names, in the order first seen
+        self.scopes = {}  # Name -> Scope
+        self.counters = []  # Counter names, in the order first seen
+        self.counter_indices = {}
+        self.stack = []  # Scopes currently open, innermost last
+
+        self.current = [0.0] * MAX_PHASES  # Self time of each phase in the frame being recorded
+        self.current_counts = [0] * MAX_COUNTERS
+        self.timings = np.zeros((capacity, MAX_PHASES))  # Seconds per phase, one row per frame
+        self.counts = np.zeros((capacity, MAX_COUNTERS), dtype=np.int64)
+        self.frame_times = np.zeros(capacity)  # Seconds between consecutive end_frame() calls
+        self.frames = 0  # Frames recorded since the profiler was last enabled
+        self.last_frame_end = None
+
+    def scope(self, name):
+        """Return a context manager timing a phase, or a no-op one while disabled."""
+        if not self.enabled:
+            return NULL_SCOPE
+        scope = self.scopes.get(name)
+        if scope is None:
+            if len(self.phases) == MAX_PHASES:
+                return NULL_SCOPE
+            scope = self.scopes[name] = Scope(self, len(self.phases))
+            self.phases.append(name)
+        return scope
+
+    def set_count(self, name, value):
+        """Record an entity count for the current frame."""
+        if not self.enabled:
+            return
+        index = self.counter_indices.get(name)
+        if index is None:
+            if len(self.counters) == MAX_COUNTERS:
+                return
+            index = self.counter_indices[name] = len(self.counters)
+            self.counters.append(name)
+        self.current_counts[index] = value
+
+    def end_frame(self):
+        """Store the frame's timings in the ring buffer and start the next frame."""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        row = self.frames % self.capacity
+        self.timings[row] = self.current
+        self.counts[row] = self.current_counts
+        self.frame_times[row] = now - self.last_frame_end if self.last_frame_end is not None else 0.0
+        self.last_frame_end = now
+        self.frames += 1
+        self.current = [0.0] * MAX_PHASES
+        self.current_counts = [0] * MAX_COUNTERS
+
+    ################################################################################################
+    # Switching
+    ################################################################################################
+    def enable(self):
+        """Start recording from an empty history."""
+        self.frames = 0
+        self.last_frame_end = None
+        self.stack = []
+        self.current = [0.0] * MAX_PHASES
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+        self.visible = False
+
+    def toggle(self):
+        """Turn the profiler and its panel on or off together."""
+        if self.enabled:
+            self.disable()
+        else:
+            self.enable()
+            self.visible = True
+
+    ################################################################################################
+    # Reading
+    ################################################################################################
+    def recorded_rows(self):
+        """Return the ring buffer row indices of the recorded frames, oldest first."""
+        count = min(self.frames, self.capacity)
+        start = self.frames - count
+        return [(start + i) % self.capacity for i in range(count)]
+
+    def get_recent(self, frames=30):
+        """Return the mean self time of each phase over the last frames, in milliseconds."""
+        rows = self.recorded_rows()[-frames:]
+        if not rows:
+            return {}
+        means = self.timings[rows, :len(self.phases)].mean(axis=0) * 1000
+        return dict(zip(self.phases, means.tolist()))
+
+    def get_frame_times(self, frames=None):
+        """Return recent frame times in milliseconds, oldest first."""
+        rows = self.recorded_rows()
+        if frames is not None:
+            rows = rows[-frames:]
+        return (self.frame_times[rows] * 1000).tolist()
+
+    def get_summary(self):
+        """Return mean, p95 and max milliseconds of every phase and of the whole frame."""
+        rows = self.recorded_rows()
+        summary = {}
+        if not rows:
+            return summary
+        columns = [("frame", self.frame_times[rows])]
+        columns += [(name, self.timings[rows, i]) for i, name in enumerate(self.phases)]
+        for name, values in columns:
+            values = values * 1000
+            summary[name] = {
+                "mean_ms": float(values.mean()),
+                "p95_ms": float(np.percentile(values, 95)),
+                "max_ms": float(values.max()),
+            }
+        return summary
+
+    ################################################################################################
+    # Exporting
+    ################################################################################################
+    def export_csv(self, path):
+        """Write one row per recorded frame: frame time, each phase and each entity count."""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        first_frame = self.frames - min(self.frames, self.capacity)
+        with open(path, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(["frame", "frame_ms"] + [f"{name}_ms" for name in self.phases] + self.counters)
+            for offset, row in enumerate(self.recorded_rows()):
+                writer.writerow(
+                    [first_frame + offset, round(self.frame_times[row] * 1000, 4)]
+                    + [round(value * 1000, 4) for value in self.timings[row, :len(self.phases)].tolist()]
+                    + self.counts[row, :len(self.counters)].tolist()
+                )
+
+    def export_json(self, path):
+        """Write the summary and every recorded frame as JSON."""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        first_frame = self.frames - min(self.frames, self.capacity)
+        frames = []
+        for offset, row in enumerate(self.recorded_rows()):
+            frames.append({
+                "frame": first_frame + offset,
+                "frame_ms": self.frame_times[row] * 1000,
+                "phases_ms": dict(zip(self.phases, (self.timings[row, :len(self.phases)] * 1000).tolist())),
+                "counts": dict(zip(self.counters, self.counts[row, :len(self.counters)].tolist())),
+            })
+        with open(path, "w") as file:
+            json.dump({"summary": self.get_summary(), "frames": frames}, file, indent=2)
+
+    def export(self, directory=PROFILE_EXPORT_DIRECTORY):
+        """Write the recorded frames as both CSV and JSON; returns the CSV path."""
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        base = os.path.join(directory, f"frame-profile-{stamp}")
+        self.export_csv(base + ".csv")
+        self.export_json(base + ".json")
+        return base + ".csv"
+
+
+# Shared profiler; off until toggled in game (F3) or enabled by a tool
+profiler = FrameProfiler()
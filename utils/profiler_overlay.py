@@ -0,0 +1,117 @@
+import arcade
+import pyglet
+from utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from utils.overlay import DEFAULT_FONT
+from utils.profiler import profiler
+
+# Panel layout, anchored to the top right corner
+PANEL_WIDTH = 360
+PANEL_LEFT = SCREEN_WIDTH - PANEL_WIDTH - 10
+PANEL_TOP = SCREEN_HEIGHT - 10
+HISTORY_HEIGHT = 60  # Height of a frame that took twice the budget
+FLAME_HEIGHT = 12
+LEGEND_LINE_HEIGHT = 13
+
+# One frame at 60 FPS; the flame bar spans exactly one budget
+FRAME_BUDGET_MS = 1000 / 60
+
+# Frames shown in the histogram, one bar each
+HISTORY_FRAMES = 120
+
+# The legend text is only re-laid out every this many frames
+LEGEND_REFRESH_FRAMES = 15
+
+# Colours cycled through the phases, in the order the profiler first saw them
+PHASE_COLORS = [
+    (230, 25, 75), (60, 180, 75), (255, 225, 25), (0, 130, 200), (245, 130, 48), (145, 30, 180),
+    (70, 240, 240), (240, 50, 230), (210, 245, 60), (250, 190, 212), (0, 128, 128), (220, 190, 255),
+    (170, 110, 40), (255, 250, 200), (128, 0, 0), (170, 255, 195), (128, 128, 0), (255, 215, 180),
+]
+
+
+class ProfilerPanel:
+    """On-screen view of the shared profiler: a flame bar and a frame-time histogram.
+
+    The flame bar stacks the mean self time of every phase over the last 30 frames against one
+    60 FPS frame budget; the histogram shows the last HISTORY_FRAMES frame times, red when over
+    budget. Everything is one pyglet batch of shapes, built on the first draw and resized in place.
+    """
+
+    def __init__(self):
+        self.batch = None
+        self.history_bars = []
+        self.segments = []  # Flame bar rectangle per phase
+        self.swatches = []  # Legend colour square per phase
+        self.legend = None
+        self.frames_drawn = 0
+
+    def build(self):
+        self.batch = pyglet.graphics.Batch()
+        bottom = PANEL_TOP - HISTORY_HEIGHT
+        self.background = pyglet.shapes.Rectangle(
+            PANEL_LEFT - 5, 0, PANEL_WIDTH + 10, 0, color=(0, 0, 0, 160), batch=self.batch
+        )
+        bar_width = PANEL_WIDTH / HISTORY_FRAMES
+        self.history_bars = [
+            pyglet.shapes.Rectangle(PANEL_LEFT + i * bar_width, bottom, bar_width, 0, batch=self.batch)
+            for i in range(HISTORY_FRAMES)
+        ]
+        # Budget line halfway up the histogram
+        self.budget_line = pyglet.shapes.Rectangle(
+            PANEL_LEFT, bottom + HISTORY_HEIGHT / 2, PANEL_WIDTH, 1, color=(255, 255, 255, 200), batch=self.batch
+        )
+        self.legend = pyglet.text.Label(
+            "", x=PANEL_LEFT + 14, y=self.flame_y() - 4, font_name=DEFAULT_FONT, font_size=8,
+            anchor_y="top", multiline=True, width=PANEL_WIDTH - 14, batch=self.batch,
+            color=arcade.get_four_byte_color(arcade.color.WHITE),
+        )
+
+    def flame_y(self):
+        return PANEL_TOP - HISTORY_HEIGHT - 6 - FLAME_HEIGHT
+
+    def add_phase(self, index):
+        """Create the flame segment and legend swatch of a newly seen phase."""
+        color = PHASE_COLORS[index % len(PHASE_COLORS)]
+        self.segments.append(
+            pyglet.shapes.Rectangle(PANEL_LEFT, self.flame_y(), 0, FLAME_HEIGHT, color=color, batch=self.batch)
+        )
+        swatch_y = self.flame_y() - 4 - (index + 1) * LEGEND_LINE_HEIGHT + 3
+        self.swatches.append(pyglet.shapes.Rectangle(PANEL_LEFT, swatch_y, 8, 8, color=color, batch=self.batch))
+
+    def update(self):
+        """Resize the shapes to the profiler's latest frames."""
+        recent = profiler.get_recent()
+        while len(self.segments) < len(recent):
+            self.add_phase(len(self.segments))
+
+        # Flame bar: phases side by side, scaled so the full width is one frame budget
+        x = PANEL_LEFT
+        for segment, ms in zip(self.segments, recent.values()):
+            width = min(ms / FRAME_BUDGET_MS * PANEL_WIDTH, PANEL_LEFT + PANEL_WIDTH - x)
+            segment.x = x
+            segment.width = width
+            x += width
+
+        # Histogram, newest frame on the right
+        frame_times = profiler.get_frame_times(HISTORY_FRAMES)
+        empty = HISTORY_FRAMES - len(frame_times)
+        for i, bar in enumerate(self.history_bars):
+            ms = frame_times[i - empty] if i >= empty else 0.0
+            bar.height = min(ms / (2 * FRAME_BUDGET_MS), 1.0) * HISTORY_HEIGHT
+            bar.color = (230, 60, 60) if ms > FRAME_BUDGET_MS else (90, 200, 90)
+
+        if self.frames_drawn % LEGEND_REFRESH_FRAMES == 0:
+            mean_frame = sum(frame_times[-30:]) / len(frame_times[-30:]) if frame_times else 0.0
+            lines = [f"{name}  {ms:.2f} ms" for name, ms in recent.items()]
+            self.legend.text = "\n".join(lines + [f"frame  {mean_frame:.2f} ms  (F3 hide, F4 export)"])
+        legend_bottom = self.flame_y() - 8 - (len(recent) + 1) * LEGEND_LINE_HEIGHT
+        self.background.y = legend_bottom
+        self.background.height = PANEL_TOP + 5 - legend_bottom
+        self.frames_drawn += 1
+
+    def draw(self):
+        if self.batch is None:
+            self.build()
+        self.update()
+        with arcade.get_window().ctx.pyglet_rendering():
+            self.batch.draw()
@@ -0,0 +1,220 @@
+import os
+import threading
+import arcade
+from collections import deque
+from pyglet import media
+from pyglet.media import codecs
+
+# How a sound is kept in memory
+STATIC = "static"  # Fully decoded once and kept resident; cheap to play many times at once
+STREAM = "stream"  # Decoded from disk while it plays; one voice at a time
+
+# Every sound the game uses: name -> (path, maximum simultaneous voices, loading mode).
+# Short effects stay resident; long music, ambience and dialogue stream.
+SOUND_MANIFEST = {
+    "jump": ("assets/sounds/game_sounds/jump.wav", 2, STATIC),
+    "coin_collection": ("assets/sounds/game_sounds/coin_collection.wav", 4, STATIC),
+    "running": ("assets/sounds/characters/running.wav", 1, STATIC),
+    "level1_dialogue": ("assets/sounds/characters/dialogue/Level1_1.wav", 1, STREAM),
+    "wind": ("assets/sounds/background/wind.wav", 1, STREAM),
+    "forest_noises": ("assets/sounds/background/forest_noises.wav", 1, STREAM),
+    "guitar_strum": ("assets/sounds/background/GuitarStrum.wav", 1, STREAM),
+}
+
+# Compressed siblings a streamed sound is read from when a decoder for them is installed
+COMPRESSED_EXTENSIONS = (".ogg", ".mp3")
+
+# Bytes at the start of a streamed file the OS is asked to read ahead when the sound is loaded
+STREAM_PREFETCH_BYTES = 256 * 1024
+
+
+def get_decodable_extensions():
+    """Return the audio file extensions the installed decoders can read."""
+    return {extension for decoder in codecs.get_decoders() for extension in decoder.get_file_extensions()}
+
+
+def find_sound_file(path, mode):
+    """Return the file to load a manifest sound from, or the manifest path if no alternative fits.
+
+    Streamed sounds prefer a compressed sibling (same name, .ogg or .mp3) so less is read from disk
+    while they play. Any sound falls back to a decodable sibling if its own file is missing.
+    """
+    stem, extension = os.path.splitext(path)
+    decodable = get_decodable_extensions()
+    siblings = [stem + ext for ext in COMPRESSED_EXTENSIONS if ext != extension and ext in decodable]
+    candidates = siblings + [path] if mode == STREAM else [path] + siblings
+    for candidate in candidates:
+        if os.path.isfile(candidate):
+            return candidate
+    return path
+
+
+def prefetch_file(path, length=STREAM_PREFETCH_BYTES):
+    """Ask the OS to start reading the beginning of a file into its page cache."""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, length, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass  # Only a hint
+
+
+def get_decoded_size(source):
+    """Return the size in bytes of a source's audio once fully decoded."""
+    audio_format = source.audio_format
+    if audio_format is None or not source.duration:
+        return 0
+    bytes_per_second = audio_format.sample_rate * audio_format.channels * audio_format.sample_size // 8
+    return int(source.duration * bytes_per_second)
+
+
+class SoundBank:
+    """Loads each sound once and plays it through a capped set of voices.
+
+    Static sounds are decoded once into memory. Streamed sounds only keep an open file and are
+    decoded while they play: the player's audio driver buffers a little ahead, and the start of
+    the file is prefetched when it is loaded. A streamed source can only feed one player, so
+    it is reopened when it is played again after its previous player.
+
+    When a sound is already playing on all of its voices, the oldest voice is
+    stolen and restarted instead of opening another one.
+
+    Sounds may be loaded from asset loader threads while the main thread plays others, so
+    loading and voice bookkeeping go through one lock.
+    """
+
+    def __init__(self, manifest=None):
+        self.manifest = manifest if manifest is not None else SOUND_MANIFEST
+        self.sounds = {}  # name -> arcade.Sound
+        self.voices = {}  # name -> deque of playing media players, oldest first
+        self.failed = set()  # Names that could not be loaded
+        self.reopens = 0  # Streamed sources opened again for a new playback
+        self._lock = threading.RLock()  # Reentrant: play() loads through get()
+
+    def load(self, name):
+        """Load a sound from the manifest if it is not loaded yet."""
+        with self._lock:
+            if name in self.sounds or name in self.failed:
+                return self.sounds.get(name)
+            path, _, mode = self.manifest[name]
+            try:
+                path = find_sound_file(path, mode)
+                self.sounds[name] = arcade.Sound(path, streaming=mode == STREAM)
+                self.voices[name] = deque()
+                if mode == STREAM:
+                    prefetch_file(path)
+            except Exception as e:
+                print(f"Error loading sound '{name}': {e}")
+                self.failed.add(name)
+            return self.sounds.get(name)
+
+    def load_all(self):
+        """Decode every sound in the manifest."""
+        for name in self.manifest:
+            self.load(name)
+
+    def get(self, name):
+        """Return the decoded sound, or None if it could not be loaded."""
+        sound = self.sounds.get(name)
+        if sound is None:
+            sound = self.load(name)
+        return sound
+
+    def play(self, name, volume=1.0, loop=False):
+        """Play a sound, stealing its oldest voice when the voice cap is reached."""
+        with self._lock:
+            sound = self.get(name)
+            if sound is None:
+                return None
+
+            voices = self.voices[name]
+            # Forget voices that have finished on their own
+            for player in list(voices):
+                if not sound.is_playing(player):
+                    voices.remove(player)
+
+            _, max_voices, mode = self.manifest[name]
+            if len(voices) >= max_voices:
+                player = voices.popleft()
+                try:
+                    # Restart the stolen voice in place instead of opening a new one
+                    player.seek(0.0)
+                    player.volume = volume
+                    player.loop = loop
+                    player.play()
+                    voices.append(player)
+                    return player
+                except Exception:
+                    sound.stop(player)
+
+            if mode == STREAM and sound.source.is_player_source:
+                # The open stream belongs to an earlier player; give the new one its own
+                try:
+                    sound.source = media.load(sound.file_name, streaming=True)
+                    self.reopens += 1
+                except Exception as e:
+                    print(f"Error reopening sound '{name}': {e}")
+                    return None
+
+            try:
+                player = sound.play(volume=volume, loop=loop)
+            except Exception as e:
+                print(f"Error playing sound '{name}': {e}")
+                return None
+            voices.append(player)
+            return player
+
+    def stop(self, name, player):
+        """Stop a voice previously returned by play()."""
+        with self._lock:
+            sound = self.sounds.get(name)
+            if sound is None or player is None:
+                return
+            voices = self.voices[name]
+            if player in voices:
+                voices.remove(player)
+            sound.stop(player)
+
+    def get_voice_count(self, name):
+        """Return how many voices of a sound are currently tracked."""
+        return len(self.voices.get(name, ()))
+
+    def get_memory_report(self):
+        """Return, for each loaded sound, how it is loaded and how much audio it keeps in memory.
+
+        decoded_bytes is the size of the whole sound as PCM; resident_bytes is what the bank keeps
+        in memory for it, which is nothing for streamed sounds beyond the player's driver buffer.
+        """
+        report = {}
+        for name, sound in self.sounds.items():
+            _, _, mode = self.manifest[name]
+            decoded_bytes = get_decoded_size(sound.source)
+            report[name] = {
+                "mode": mode,
+                "file": sound.file_name,
+                "file_bytes": os.path.getsize(sound.file_name),
+                "duration": round(sound.get_length() or 0.0, 2),
+                "decoded_bytes": decoded_bytes,
+                "resident_bytes": decoded_bytes if mode == STATIC else 0,
+            }
+        return report
+
+    def get_stats(self):
+        """Return totals over every loaded sound."""
+        report = self.get_memory_report().values()
+        return {
+            "static": sum(1 for entry in report if entry["mode"] == STATIC),
+            "streamed": sum(1 for entry in report if entry["mode"] == STREAM),
+            "resident_bytes": sum(entry["resident_bytes"] for entry in report),
+            "streamed_decoded_bytes": sum(entry["decoded_bytes"] for entry in report if entry["mode"] == STREAM),
+            "failed": len(self.failed),
+            "reopens": self.reopens,
+        }
+
+
+# Shared sound bank used by every view and entity
+sound_bank = SoundBank()
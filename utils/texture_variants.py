@@ -0,0 +1,74 @@
+import hashlib
+import os
+import threading
+from PIL import Image
+
+# Down-scaled copies of sprite sheets and menu art, generated on first use
+TEXTURE_CACHE_DIR = ".cache/textures"
+
+_source_hashes = {}  # Source path -> content hash, so each file is hashed once per run
+
+
+def scaled_size(width, height, scale):
+    """Return the pixel size of a width x height image drawn at scale."""
+    return max(1, round(width * scale)), max(1, round(height * scale))
+
+
+def source_hash(path):
+    """Return a short content hash of a source image."""
+    digest = _source_hashes.get(path)
+    if digest is None:
+        with open(path, "rb") as file:
+            digest = hashlib.sha1(file.read()).hexdigest()[:16]
+        _source_hashes[path] = digest
+    return digest
+
+
+def prepare_strip(sprite_sheet_path, frame_width, frame_height, frame_count, target_width, target_height):
+    """Return the path of a copy of a sprite-sheet strip with every frame resized to the target size.
+
+    Frames are resized one by one so neighbouring frames never bleed into each other, and with
+    an area-averaging filter so the result matches what the GPU would show with mipmapping.
+    The variant is keyed by the source's content hash and the target size, so editing the
+    source sheet produces a new variant. Returns None if the variant cannot be built.
+    """
+    try:
+        digest = source_hash(sprite_sheet_path)
+        name = os.path.splitext(os.path.basename(sprite_sheet_path))[0]
+        variant_path = os.path.join(
+            TEXTURE_CACHE_DIR,
+            f"{name}-{digest}-{frame_width}x{frame_height}x{frame_count}-{target_width}x{target_height}.png",
+        )
+        if os.path.exists(variant_path):
+            return variant_path
+
+        os.makedirs(TEXTURE_CACHE_DIR, exist_ok=True)
+        with Image.open(sprite_sheet_path) as source:
+            source = source.convert("RGBA")
+            strip = Image.new("RGBA", (target_width * frame_count, target_height))
+            for i in range(frame_count):
+                frame = source.crop((i * frame_width, 0, (i + 1) * frame_width, frame_height))
+                strip.paste(frame.resize((target_width, target_height), Image.BOX), (i * target_width, 0))
+
+        # Write next to the final name and swap it in, so a crash never leaves a torn file
+        # and loader threads preparing the same variant never write to the same temp file
+        temp_path = f"{variant_path}.{os.getpid()}-{threading.get_ident()}.tmp"
+        strip.save(temp_path, format="PNG")
+        os.replace(temp_path, variant_path)
+        return variant_path
+    except Exception as e:
+        print(f"Error preparing scaled variant of '{sprite_sheet_path}': {e}")
+        return None
+
+
+def prepare_image(path, target_width, target_height):
+    """Return the path of a copy of a whole image resized to the target size, or None on failure."""
+    try:
+        with Image.open(path) as source:
+            width, height = source.size
+    except Exception as e:
+        print(f"Error preparing scaled variant of '{path}': {e}")
+        return None
+    if (width, height) == (target_width, target_height):
+        return path
+    return prepare_strip(path, width, height, 1, target_width, target_height)
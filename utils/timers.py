@@ -0,0 +1,164 @@
+import heapq
+from itertools import count
+
+
+class Timer:
+    """A callback waiting on a TimerScheduler; keep it to cancel the callback later."""
+    __slots__ = ("callback", "interval", "owner", "due", "entry", "remaining")
+
+    def __init__(self, callback, interval, owner):
+        self.callback = callback
+        self.interval = interval  # Seconds between calls for a repeating timer, None for a one-shot
+        self.owner = owner
+        self.due = 0.0  # Game time of the next call
+        self.entry = None  # Sequence number of the heap entry that is still valid, None when not queued
+        self.remaining = 0.0  # Time left when the owner was paused
+
+
+class TimerScheduler:
+    """One-shot and repeating callbacks on a game clock that only moves when advance() is called.
+
+    Timers sit in a heap ordered by due time, so advancing costs one comparison when nothing is
+    due and O(log n) per call. Every timer belongs to an owner (usually a view) so all of its
+    timers can be paused, resumed or cancelled together; paused time does not count towards
+    them. Cancelled timers are dropped from the heap lazily, and the heap is rebuilt when they
+    make up most of it, so its size stays bounded by the live timers over a long session.
+    """
+
+    def __init__(self):
+        self.time = 0.0  # Game seconds advanced so far
+        self.heap = []  # (due, sequence, timer); entries whose sequence no longer matches are stale
+        self.sequence = count()
+        self.owners = {}  # Owner -> set of its live timers
+        self.paused_owners = set()
+        self.stale = 0  # Stale entries still in the heap
+        self.fired = 0  # Callbacks run so far
+
+    ################################################################################################
+    # Scheduling
+    ################################################################################################
+    def schedule_once(self, callback, delay, owner=None):
+        """Call callback() once, delay game seconds from now."""
+        return self.add(Timer(callback, None, owner), delay)
+
+    def schedule_interval(self, callback, interval, owner=None):
+        """Call callback() every interval game seconds until the timer is cancelled."""
+        return self.add(Timer(callback, interval, owner), interval)
+
+    def add(self, timer, delay):
+        self.owners.setdefault(timer.owner, set()).add(timer)
+        if timer.owner in self.paused_owners:
+            timer.remaining = max(delay, 0.0)
+        else:
+            self.push(timer, self.time + delay)
+        return timer
+
+    def push(self, timer, due):
+        timer.due = due
+        timer.entry = next(self.sequence)
+        heapq.heappush(self.heap, (due, timer.entry, timer))
+
+    def invalidate(self, timer):
+        """Mark a timer's heap entry stale."""
+        if timer.entry is not None:
+            timer.entry = None
+            self.stale += 1
+
+    ################################################################################################
+    # Cancelling and Pausing
+    ################################################################################################
+    def cancel(self, timer):
+        """Stop a timer; cancelling a timer that already finished does nothing."""
+        self.invalidate(timer)
+        timer.remaining = 0.0
+        timers = self.owners.get(timer.owner)
+        if timers is not None:
+            timers.discard(timer)
+            if not timers:
+                del self.owners[timer.owner]
+        self.compact()
+
+    def cancel_owner(self, owner):
+        """Cancel every timer of an owner, e.g. when its view closes."""
+        for timer in list(self.owners.get(owner, ())):
+            self.cancel(timer)
+        self.paused_owners.discard(owner)
+
+    def pause(self, owner):
+        """Freeze an owner's timers; the time they have left is kept until resume()."""
+        if owner in self.paused_owners:
+            return
+        self.paused_owners.add(owner)
+        for timer in self.owners.get(owner, ()):
+            timer.remaining = max(timer.due - self.time, 0.0)
+            self.invalidate(timer)
+        self.compact()
+
+    def resume(self, owner):
+        """Let a paused owner's timers run again from where they stopped."""
+        if owner not in self.paused_owners:
+            return
+        self.paused_owners.discard(owner)
+        for timer in self.owners.get(owner, ()):
+            self.push(timer, self.time + timer.remaining)
+            timer.remaining = 0.0
+
+    def compact(self):
+        """Rebuild the heap without stale entries once they outnumber the live ones."""
+        if self.stale > 16 and self.stale * 2 > len(self.heap):
+            self.heap = [item for item in self.heap if item[2].entry == item[1]]
+            heapq.heapify(self.heap)
+            self.stale = 0
+
+    ################################################################################################
+    # Running
+    ################################################################################################
+    def advance(self, delta_time):
+        """Move the game clock forward and run every callback that came due, in due order."""
+        self.time += delta_time
+        while self.heap and self.heap[0][0] <= self.time:
+            due, entry, timer = heapq.heappop(self.heap)
+            if timer.entry != entry:
+                self.stale -= 1
+                continue
+
+            if timer.interval is None:
+                timer.entry = None
+                self.cancel(timer)
+            else:
+                # Missed repeats are dropped rather than run back to back after a long frame
+                next_due = due + timer.interval
+                self.push(timer, next_due if next_due > self.time else self.time + timer.interval)
+
+            self.fired += 1
+            try:
+                timer.callback()
+            except Exception as e:
+                print(f"Error in timer callback {getattr(timer.callback, '__name__', timer.callback)}: {e}")
+
+    def time_left(self, timer):
+        """Return the game seconds until a timer fires next, or None once it finished or was cancelled."""
+        if timer not in self.owners.get(timer.owner, ()):
+            return None
+        if timer.owner in self.paused_owners:
+            return timer.remaining
+        return max(timer.due - self.time, 0.0)
+
+    def get_live_count(self, owner=None):
+        """Return how many timers are scheduled, for one owner or in total."""
+        if owner is not None:
+            return len(self.owners.get(owner, ()))
+        return sum(len(timers) for timers in self.owners.values())
+
+    def get_stats(self):
+        return {
+            "live": self.get_live_count(),
+            "owners": len(self.owners),
+            "paused_owners": len(self.paused_owners),
+            "heap": len(self.heap),
+            "fired": self.fired,
+        }
+
+
+# Shared game clock, advanced once per frame by the window
+timers = TimerScheduler()
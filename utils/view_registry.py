@@ -0,0 +1,70 @@
+import importlib
+import arcade
+
+# Views the game moves between, by name; imported on first use because the views themselves
+# go through the registry to move on to the next one
+VIEW_CLASSES = {
+    "loading": ("core.loading_screen", "LoadingScreen"),
+    "title": ("menus.title", "Title"),
+    "game": ("core.game_window", "GameWindow"),
+    "pause": ("menus.pause", "Pause"),
+    "game_over": ("menus.game_over", "GameOver"),
+}
+
+
+class ViewRegistry:
+    """Builds each view once and shows the same instance on every later visit.
+
+    show() calls two optional hooks on the view: reset(**kwargs) before it is shown, to start
+    the visit from a clean state (a new run, a new final score), and enter() once it is shown,
+    to refresh whatever depends on the rest of the game (coin totals, the leaderboard).
+    Textures, sprite lists, labels and pools built in a view's __init__ persist across
+    transitions, so a menu/game round trip costs the same however many times it is made.
+    """
+
+    def __init__(self):
+        self.factories = {}  # Name -> callable building the view, overriding VIEW_CLASSES
+        self.views = {}  # Name -> the view built for it
+        self.builds = 0  # Views constructed so far
+        self.visits = 0  # Calls to show()
+
+    def register(self, name, factory):
+        """Build a view with factory() instead of its VIEW_CLASSES class; drops a view already built."""
+        self.factories[name] = factory
+        self.views.pop(name, None)
+
+    def get(self, name):
+        """Return the view of a name, building it on first use."""
+        view = self.views.get(name)
+        if view is None:
+            factory = self.factories.get(name)
+            if factory is None:
+                module_name, class_name = VIEW_CLASSES[name]
+                factory = getattr(importlib.import_module(module_name), class_name)
+            view = self.views[name] = factory()
+            self.builds += 1
+        return view
+
+    def show(self, name, **kwargs):
+        """Reset the view with kwargs, show it in the window and let it refresh itself."""
+        view = self.get(name)
+        reset = getattr(view, "reset", None)
+        if reset is not None:
+            reset(**kwargs)
+        arcade.get_window().show_view(view)
+        enter = getattr(view, "enter", None)
+        if enter is not None:
+            enter()
+        self.visits += 1
+        return view
+
+    def get_stats(self):
+        return {
+            "views": sorted(self.views),
+            "builds": self.builds,
+            "visits": self.visits,
+        }
+
+
+# Shared registry of the game's views
+views = ViewRegistry()